@@ -6,6 +6,7 @@ GRIMOIRE projects and systems.
 """
 
 import shutil
+import sys
 from pathlib import Path
 from typing import Optional, Union
 
@@ -214,7 +215,8 @@ A GRIMOIRE system created with GRIMOIRE Design Studio.
 
                 if model_data and isinstance(model_data, dict):
                     model = ModelDefinition.model_validate(model_data)
-                    models[model.id] = model
+                    # Interned so flow type lookups compare by identity
+                    models[sys.intern(model.id)] = model
 
             except Exception as e:
                 # Log error but continue loading other models
@@ -7,6 +7,7 @@ These models match the actual YAML format used by GRIMOIRE systems.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Union
 
@@ -14,6 +15,18 @@ from typing import Any, Union
 from grimoire_model import AttributeDefinition, ModelDefinition  # noqa: F401
 
 
+def _intern_type(value: Any) -> Any:
+    """Intern a type name so model ID lookups can compare by identity.
+
+    Args:
+        value: Type name from YAML data
+
+    Returns:
+        The interned string, or the value unchanged if it is not a string
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 @dataclass
 class CurrencyDenomination:
     """Definition of a currency denomination.
@@ -182,7 +195,7 @@ class FlowInputOutput:
     def from_dict(cls, data: dict[str, Any]) -> FlowInputOutput:
         """Create FlowInputOutput from dictionary data."""
         return cls(
-            type=data["type"],
+            type=_intern_type(data["type"]),
             id=data["id"],
             required=data.get("required"),
             validate=data.get("validate"),
@@ -209,7 +222,7 @@ class FlowVariable:
     def from_dict(cls, data: dict[str, Any]) -> FlowVariable:
         """Create FlowVariable from dictionary data."""
         return cls(
-            type=data["type"],
+            type=_intern_type(data["type"]),
             id=data["id"],
             description=data.get("description"),
             validate=data.get("validate"),
@@ -557,7 +570,7 @@ class CompleteSystem:
 
         # Load all component types
         models = {
-            model_id: ModelDefinition.model_validate(model_data)
+            _intern_type(model_id): ModelDefinition.model_validate(model_data)
             for model_id, model_data in data.get("models", {}).items()
         }
 
@@ -6,7 +6,7 @@ flow execution, and other core services.
 """
 
 from .dice_service import DiceRollResult, DiceService
-from .llm_service import LLMConfig, LLMResult, LLMService
+from .llm_service import LLMConfig, LLMResult, LLMService, SemanticCache
 from .name_service import NameService
 from .object_service import ObjectInstantiationService
 
@@ -18,4 +18,5 @@ __all__ = [
     "LLMService",
     "NameService",
     "ObjectInstantiationService",
+    "SemanticCache",
 ]
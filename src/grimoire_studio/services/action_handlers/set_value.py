@@ -11,6 +11,14 @@ from ..decorators import handle_execution_error
 
 logger = get_logger(__name__)
 
+# Python type of each primitive flow type
+_PRIMITIVE_PYTHON_TYPES: dict[str, type] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+}
+
 
 class SetValueActionHandler:
     """Handler for set_value actions."""
@@ -60,11 +68,13 @@ class SetValueActionHandler:
             value = context.resolve_template(value)
 
         # Resolve template in path
-        resolved_path = context.resolve_template(path)
+        resolved_path = str(context.resolve_template(path))
 
-        # Coerce to expected type based on path
-        expected_type = self.type_getter(str(resolved_path))
-        value = self.value_coercer(value, expected_type, str(resolved_path))
+        # Coerce to expected type based on path, unless the value already
+        # has exactly the expected primitive type (so bool is not an int)
+        expected_type = self.type_getter(resolved_path)
+        if type(value) is not _PRIMITIVE_PYTHON_TYPES.get(expected_type or ""):
+            value = self.value_coercer(value, expected_type, resolved_path)
 
         logger.debug(f"Setting value at resolved path: {resolved_path}")
-        return context.set_variable(str(resolved_path), value)
+        return context.set_variable(resolved_path, value)
@@ -11,6 +11,8 @@ from typing import Any
 from grimoire_logging import get_logger
 from wyrdbound_dice import Dice
 
+# roll_dice runs once per item in dice sequences, so its logs use %-style
+# arguments and are only formatted when the level is enabled
 logger = get_logger(__name__)
 
 
@@ -114,7 +116,7 @@ class DiceService:
             raise ValueError("Dice expression cannot be empty")
 
         expression = expression.strip()
-        logger.debug(f"Rolling dice: {expression}")
+        logger.debug("Rolling dice: %s", expression)
 
         try:
             # Use wyrdbound-dice to roll
@@ -124,12 +126,12 @@ class DiceService:
             total = result_set.total
             description = str(result_set)
 
-            # Try to extract individual rolls if available
-            rolls = []
-            if hasattr(result_set, "results") and result_set.results:
-                for roll_result in result_set.results:
-                    if hasattr(roll_result, "rolls"):
-                        rolls.extend(roll_result.rolls)
+            # Extract individual rolls if available
+            rolls = [
+                roll
+                for roll_result in getattr(result_set, "results", None) or ()
+                for roll in getattr(roll_result, "rolls", ())
+            ]
 
             roll_result = DiceRollResult(
                 expression=expression,
@@ -138,7 +140,7 @@ class DiceService:
                 rolls=rolls,
             )
 
-            logger.info(f"Dice roll result: {roll_result.total}")
+            logger.info("Dice roll result: %s", total)
             return roll_result
 
         except Exception as e:
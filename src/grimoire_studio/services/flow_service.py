@@ -9,7 +9,10 @@ if it is not available, following the principle of explicit errors over fallback
 
 from __future__ import annotations
 
-import uuid
+import functools
+import itertools
+from collections import OrderedDict
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from grimoire_context import (
@@ -42,6 +45,62 @@ from .step_executors.table_roll import TableRollStepExecutor
 
 logger = get_logger(__name__)
 
+# Maximum number of model coercion results kept per flow execution
+_MODEL_COERCE_CACHE_SIZE = 256
+
+# Scalar types _freeze() stores as-is; anything else is not cached
+_FROZEN_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dotted context path into its parts, memoized per path string."""
+    return tuple(path.split("."))
+
+
+def _freeze(value: Any) -> tuple[Any, ...]:
+    """Convert plain data to a hashable form that keeps its types distinct.
+
+    Every node is tagged with its exact type, so 1 and 1.0, or a list and
+    a tuple with the same items, freeze to different values.
+
+    Args:
+        value: Nested dicts, lists and tuples of scalar values
+
+    Returns:
+        Hashable frozen representation, reversible with _thaw()
+
+    Raises:
+        TypeError: If the value contains any other type
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return (dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if value_type is list or value_type is tuple:
+        return (value_type, tuple(_freeze(item) for item in value))
+    if value_type in _FROZEN_SCALAR_TYPES:
+        return (value_type, value)
+    raise TypeError(f"Cannot freeze value of type {value_type.__name__}")
+
+
+def _thaw(frozen: tuple[Any, ...]) -> Any:
+    """Rebuild a fresh copy of plain data frozen by _freeze().
+
+    Args:
+        frozen: Frozen representation
+
+    Returns:
+        The original value, built from new containers
+    """
+    value_type, data = frozen
+    if value_type is dict:
+        return {_thaw(k): _thaw(v) for k, v in data}
+    if value_type is list:
+        return [_thaw(item) for item in data]
+    if value_type is tuple:
+        return tuple(_thaw(item) for item in data)
+    return data
+
 
 class _TemplateResolverAdapter:
     """Adapter to match TemplateResolver protocol parameter naming."""
@@ -95,6 +154,13 @@ class FlowExecutionService:
         self.template_resolver = _TemplateResolverAdapter(Jinja2TemplateResolver())
         self.current_context: GrimoireContext | None = None
         self.current_flow: FlowDefinition | None = None
+        # Step namespaces only need to be unique within this service, so a
+        # counter prefixed with the instance id replaces a uuid4 per step
+        self._step_prefix = f"step_{id(self):x}_"
+        self._step_counter = itertools.count()
+        self._model_coerce_cache: OrderedDict[
+            tuple[str, tuple[Any, ...]], tuple[Any, ...]
+        ] = OrderedDict()
 
         # Initialize services (create defaults if not provided)
         self.dice_service = dice_service or DiceService()
@@ -142,7 +208,7 @@ class FlowExecutionService:
         inputs: dict[str, Any] | None = None,
         on_step_complete: Callable[[str, dict[str, Any]], None] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
     ) -> dict[str, Any]:
         """Execute a flow with the given inputs.
 
@@ -160,10 +226,10 @@ class FlowExecutionService:
             ValueError: If flow not found or inputs invalid
             FlowExecutionError: If execution fails
         """
-        if flow_id not in self.system.flows:
+        flow_def = self.system.flows.get(flow_id)
+        if flow_def is None:
             raise ValueError(f"Flow not found: {flow_id}")
 
-        flow_def = self.system.flows[flow_id]
         self.current_flow = flow_def
         logger.info(f"Starting flow execution: {flow_id}")
 
@@ -190,6 +256,7 @@ class FlowExecutionService:
         finally:
             self.current_context = None
             self.current_flow = None
+            self._model_coerce_cache.clear()
 
     def _initialize_context(
         self, flow_def: FlowDefinition, inputs: dict[str, Any]
@@ -226,8 +293,10 @@ class FlowExecutionService:
             "variables": variables,
         }
 
-        context = GrimoireContext(context_data)
-        context = context.set_template_resolver(self.template_resolver)
+        # Bind the resolver at construction instead of cloning to attach it
+        context = GrimoireContext(
+            context_data, template_resolver=self.template_resolver
+        )
         logger.debug("Context initialized successfully")
         return context
 
@@ -237,7 +306,7 @@ class FlowExecutionService:
         context: GrimoireContext,
         on_step_complete: Callable[[str, dict[str, Any]], None] | None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None,
     ) -> GrimoireContext:
         """Execute flow steps in sequence.
 
@@ -308,11 +377,11 @@ class FlowExecutionService:
         step: FlowStep,
         context: GrimoireContext,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None,
     ) -> tuple[GrimoireContext, dict[str, Any]]:
         """Execute a single flow step with proper context management.
 
-        Creates a step-specific context namespace (step_<uuid>) to store
+        Creates a step-specific context namespace (step_<id>) to store
         temporary data like 'result', 'item', and 'config'. This prevents
         collisions in concurrent step execution. The namespace is cleaned
         up after the step completes.
@@ -330,7 +399,7 @@ class FlowExecutionService:
             FlowExecutionError: If step execution fails
         """
         # Create unique step namespace to prevent concurrent step collisions
-        step_namespace = f"step_{uuid.uuid4().hex}"
+        step_namespace = f"{self._step_prefix}{next(self._step_counter)}"
         logger.debug(
             f"Executing step: {step.id} ({step.type}) in namespace {step_namespace}"
         )
@@ -351,15 +420,13 @@ class FlowExecutionService:
             )
 
             # Create convenient top-level aliases for step data
-            # This allows templates to use {{ result }} instead of {{ step_<uuid>.result }}
-            if context.has_variable(f"{step_namespace}.result"):
-                context = context.set_variable(
-                    "result", context.get_variable(f"{step_namespace}.result")
-                )
-            if context.has_variable(f"{step_namespace}.item"):
-                context = context.set_variable(
-                    "item", context.get_variable(f"{step_namespace}.item")
-                )
+            # This allows templates to use {{ result }} instead of {{ step_<id>.result }}
+            # The namespace is read once rather than probing each dotted path
+            step_data = context.get_variable(step_namespace, {})
+            if "result" in step_data:
+                context = context.set_variable("result", step_data["result"])
+            if "item" in step_data:
+                context = context.set_variable("item", step_data["item"])
 
             # Execute actions if any
             if step.actions:
@@ -368,13 +435,12 @@ class FlowExecutionService:
                     context = self._execute_action(action, context, on_action_execute)
 
             # Build step result for callback (before cleanup)
-            step_result = self._build_step_result(step, context, step_namespace)
+            step_data = context.get_variable(step_namespace, {})
+            step_result = self._build_step_result(step, step_data)
 
             # Check for next_step_override from player_choice
-            if context.has_variable(f"{step_namespace}.next_step_override"):
-                step_result["next_step_override"] = context.get_variable(
-                    f"{step_namespace}.next_step_override"
-                )
+            if "next_step_override" in step_data:
+                step_result["next_step_override"] = step_data["next_step_override"]
 
             return context, step_result
 
@@ -392,15 +458,16 @@ class FlowExecutionService:
             if "item" in context_dict:
                 del context_dict["item"]
 
-            context = GrimoireContext(context_dict)
-            context = context.set_template_resolver(self.template_resolver)
+            context = GrimoireContext(
+                context_dict, template_resolver=self.template_resolver
+            )
 
     def _execute_step_logic(
         self,
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None,
     ) -> GrimoireContext:
         """Execute the step-specific logic based on step type.
@@ -429,14 +496,13 @@ class FlowExecutionService:
             return context
 
     def _build_step_result(
-        self, step: FlowStep, context: GrimoireContext, step_namespace: str
+        self, step: FlowStep, step_data: dict[str, Any]
     ) -> dict[str, Any]:
         """Build step result dict for callback.
 
         Args:
             step: Step that was executed
-            context: Current execution context
-            step_namespace: Namespace where step data is stored
+            step_data: Contents of the step's namespace
 
         Returns:
             Dictionary with step result information
@@ -444,8 +510,8 @@ class FlowExecutionService:
         result: dict[str, Any] = {"step_id": step.id, "step_type": step.type}
 
         # Try to get result from step namespace
-        if context.has_variable(f"{step_namespace}.result"):
-            result["result"] = context.get_variable(f"{step_namespace}.result")
+        if "result" in step_data:
+            result["result"] = step_data["result"]
 
         return result
 
@@ -514,28 +580,42 @@ class FlowExecutionService:
         Returns:
             Dictionary with templates resolved
         """
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, str):
-                result[key] = context.resolve_template(value)
-            elif isinstance(value, dict):
-                result[key] = self._resolve_templates_in_dict(value, context)
-            elif isinstance(value, list):
-                result[key] = [
-                    (
-                        context.resolve_template(item)
-                        if isinstance(item, str)
-                        else (
-                            self._resolve_templates_in_dict(item, context)
-                            if isinstance(item, dict)
-                            else item
-                        )
-                    )
-                    for item in value
-                ]
-            else:
-                result[key] = value
-        return result
+        # Bind once rather than looking the method up for every value
+        resolve = context.resolve_template
+        resolve_value = self._resolve_template_value
+        return {
+            key: resolve_value(value, context, resolve) for key, value in data.items()
+        }
+
+    def _resolve_template_value(
+        self,
+        value: Any,
+        context: GrimoireContext,
+        resolve: Callable[[str], Any],
+        in_list: bool = False,
+    ) -> Any:
+        """Resolve templates in a single dictionary value or list item.
+
+        Args:
+            value: Value potentially containing template strings
+            context: Current execution context
+            resolve: The context's bound resolve_template
+            in_list: Whether the value is a list item; lists nested directly
+                in lists are passed through unchanged
+
+        Returns:
+            Value with templates resolved
+        """
+        if isinstance(value, str):
+            return resolve(value)
+        if isinstance(value, dict):
+            return self._resolve_templates_in_dict(value, context)
+        if isinstance(value, list) and not in_list:
+            return [
+                self._resolve_template_value(item, context, resolve, in_list=True)
+                for item in value
+            ]
+        return value
 
     def _get_expected_type_for_path(self, path: str) -> str | None:
         """Get the expected type for a flow path, including nested attributes.
@@ -558,7 +638,7 @@ class FlowExecutionService:
         if not self.current_flow:
             return None
 
-        parts = path.split(".")
+        parts = _split_path(path)
         if len(parts) < 2:
             return None
 
@@ -595,30 +675,28 @@ class FlowExecutionService:
         return self._resolve_nested_type(top_level_type, parts[2:])
 
     def _resolve_nested_type(
-        self, model_type: str, remaining_path: list[str]
+        self, model_type: str, remaining_path: tuple[str, ...]
     ) -> str | None:
         """Resolve type through nested model attributes.
 
         Args:
             model_type: The model type to start from (e.g., "character")
-            remaining_path: Remaining path parts (e.g., ["stats", "hp"])
+            remaining_path: Remaining path parts (e.g., ("stats", "hp"))
 
         Returns:
             The final type, or None if path cannot be resolved
         """
         # Check if this is a model in our system
-        if model_type not in self.system.models:
+        current_model = self.system.models.get(model_type)
+        if current_model is None:
             # Not a model, can't resolve further
             return None
 
-        current_model = self.system.models[model_type]
-        current_field = remaining_path[0]
-
         # Look up the attribute in the model
-        if current_field not in current_model.attributes:
+        attribute = current_model.attributes.get(remaining_path[0])
+        if attribute is None:
             return None
 
-        attribute = current_model.attributes[current_field]
         attribute_type: str = attribute.type
 
         # If this is the last part of the path, return the type
@@ -665,11 +743,18 @@ class FlowExecutionService:
         # If instantiation fails (invalid data), return as-is to allow
         # deferred validation via validate_value action
         if expected_type in self.system.models and isinstance(value, dict):
+            # Identical payloads assigned repeatedly (e.g. in a loop step)
+            # resolve to the same model dict, so reuse the first result
+            cache_key = self._model_coerce_key(expected_type, value)
+            if cache_key is not None and cache_key in self._model_coerce_cache:
+                self._model_coerce_cache.move_to_end(cache_key)
+                return _thaw(self._model_coerce_cache[cache_key])
+
             try:
                 # Create GrimoireModel instance (applies defaults/derived attrs)
                 model_obj = self.object_service.create_object(value)
                 # Convert to fully-resolved dict representation
-                return dict(model_obj)
+                resolved = dict(model_obj)
             except Exception:
                 # Data is invalid - return as-is and let validate_value catch it
                 logger.debug(
@@ -678,9 +763,36 @@ class FlowExecutionService:
                 )
                 return value
 
+            if cache_key is not None:
+                try:
+                    self._model_coerce_cache[cache_key] = _freeze(resolved)
+                except TypeError:
+                    return resolved
+                if len(self._model_coerce_cache) > _MODEL_COERCE_CACHE_SIZE:
+                    self._model_coerce_cache.popitem(last=False)
+            return resolved
+
         # For other types, return as-is
         return value
 
+    @staticmethod
+    def _model_coerce_key(
+        expected_type: str, value: dict[str, Any]
+    ) -> tuple[str, tuple[Any, ...]] | None:
+        """Build the model coercion cache key for a value.
+
+        Args:
+            expected_type: Model type the value is coerced to
+            value: Raw model data
+
+        Returns:
+            Cache key, or None if the value holds types that cannot be frozen
+        """
+        try:
+            return expected_type, _freeze(value)
+        except TypeError:
+            return None
+
     def _extract_outputs(
         self, flow_def: FlowDefinition, context: GrimoireContext
     ) -> dict[str, Any]:
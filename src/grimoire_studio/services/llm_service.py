@@ -6,14 +6,332 @@ to handle LLM prompt execution operations in GRIMOIRE flows.
 
 from __future__ import annotations
 
-import urllib.error
-import urllib.request
+import asyncio
+import functools
+import hashlib
+import http.client
+import json
+import math
+import string
+import threading
+import time
+import urllib.parse
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from grimoire_logging import get_logger
 
 logger = get_logger(__name__)
 
+# orjson (optional "speedups" extra) serializes straight to bytes in native
+# code; the standard library is used when it is not installed
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - depends on installed extras
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
+# Response cache bounds. Prompts sampled above this temperature are
+# expected to vary between runs, so they are never served from cache.
+_RESPONSE_CACHE_SIZE = 512
+_CACHEABLE_MAX_TEMPERATURE = 0.3
+
+_DEFAULT_OLLAMA_URL = "http://localhost:11434"
+
+# Recent is_ollama_available() results: base_url -> (checked at, available)
+_AVAILABILITY_CACHE: dict[str, tuple[float, bool]] = {}
+_AVAILABILITY_CACHE_LOCK = threading.Lock()
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_template(prompt: str) -> tuple[tuple[str, str | None], ...] | None:
+    """Split a prompt template into literal text and field names.
+
+    Args:
+        prompt: Prompt with {variable} placeholders
+
+    Returns:
+        Tuple of (literal text, field name or None) segments, or None if
+        the template uses positional, attribute, index, conversion or
+        format-spec fields that need full str.format handling
+
+    Raises:
+        ValueError: If the template is malformed
+    """
+    segments: list[tuple[str, str | None]] = []
+    for literal, field, spec, conversion in string.Formatter().parse(prompt):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        segments.append((literal, field))
+    return tuple(segments)
+
+
+def format_prompt(template: str, variables: Mapping[str, Any]) -> str:
+    """Fill a {variable} prompt template, like template.format(**variables).
+
+    Parsed templates are cached, so repeated prompts skip re-parsing the
+    format string.
+
+    Args:
+        template: Prompt template with {variable} placeholders
+        variables: Variable values
+
+    Returns:
+        Formatted prompt
+
+    Raises:
+        KeyError: If a placeholder has no value in variables
+        ValueError: If the template is malformed
+    """
+    # Nothing to substitute or unescape in a brace-free template
+    if "{" not in template and "}" not in template:
+        return template
+
+    segments = _parse_template(template)
+    if segments is None:
+        return template.format(**variables)
+    parts: list[str] = []
+    for literal, field in segments:
+        parts.append(literal)
+        if field is not None:
+            parts.append(format(variables[field], ""))
+    return "".join(parts)
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words, matching len(text.split()).
+
+    Stripped single-spaced text (the common case for prompts) is counted
+    without materializing the word list.
+
+    Args:
+        text: Text to count
+
+    Returns:
+        Number of words
+    """
+    if not text:
+        return 0
+    if text.isprintable() and "  " not in text and text[0] != " " != text[-1]:
+        return text.count(" ") + 1
+    return len(text.split())
+
+
+# Keep-alive HTTP connections, one per (scheme, host) per thread.
+# http.client connections are not thread safe, so each worker thread
+# (e.g. those used by aexecute_prompts) keeps its own pool.
+_connection_pool = threading.local()
+
+
+class _ThreadConnections:
+    """Idle connections of one thread, closed when the thread exits."""
+
+    def __init__(self) -> None:
+        self.connections: dict[tuple[str, str], http.client.HTTPConnection] = {}
+        # Runs when the thread-local storage holding this object is released
+        weakref.finalize(self, _close_connections, self.connections)
+
+
+def _close_connections(
+    connections: dict[tuple[str, str], http.client.HTTPConnection],
+) -> None:
+    """Close and forget pooled connections.
+
+    Args:
+        connections: Idle connections keyed by (scheme, host)
+    """
+    for connection in connections.values():
+        connection.close()
+    connections.clear()
+
+
+def _open_response(
+    method: str,
+    url: str,
+    body: bytes | None,
+    headers: dict[str, str] | None,
+    timeout: float,
+) -> tuple[tuple[str, str], http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Send a request over a pooled keep-alive connection.
+
+    The connection is taken out of the pool; callers hand it back with
+    _release_connection once the response has been fully read. A
+    connection that the server has closed since its last use is reopened
+    once before the error is propagated.
+
+    Args:
+        method: HTTP method
+        url: Absolute http(s) URL
+        body: Request body (optional)
+        headers: Request headers (optional)
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Tuple of (pool key, connection, unread response)
+
+    Raises:
+        ValueError: If the URL scheme is not http or https
+        OSError: If the request fails
+        http.client.HTTPException: If the response is malformed
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    key = (parts.scheme, parts.netloc)
+
+    def send(
+        connection: http.client.HTTPConnection,
+    ) -> http.client.HTTPResponse:
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        try:
+            connection.request(method, path, body=body, headers=headers or {})
+            return connection.getresponse()
+        except BaseException:
+            connection.close()
+            raise
+
+    connection = _pooled_connections().pop(key, None)
+    if connection is not None:
+        try:
+            return key, connection, send(connection)
+        except (http.client.HTTPException, ConnectionError):
+            # Stale keep-alive connection; retry once on a fresh one
+            logger.debug(f"Reconnecting to {parts.netloc}")
+
+    connection_class = (
+        http.client.HTTPSConnection
+        if parts.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    connection = connection_class(parts.netloc, timeout=timeout)
+    return key, connection, send(connection)
+
+
+def _pooled_connections() -> dict[tuple[str, str], http.client.HTTPConnection]:
+    """Get the calling thread's idle connections keyed by (scheme, host)."""
+    pool: _ThreadConnections | None = getattr(_connection_pool, "pool", None)
+    if pool is None:
+        pool = _connection_pool.pool = _ThreadConnections()
+    return pool.connections
+
+
+def _release_connection(
+    key: tuple[str, str],
+    connection: http.client.HTTPConnection,
+    response: http.client.HTTPResponse,
+) -> None:
+    """Return a connection to the pool, or close it if it cannot be reused.
+
+    Args:
+        key: Pool key from _open_response
+        connection: Connection the response was read from
+        response: Response that has been read to the end
+    """
+    if response.will_close or not response.isclosed():
+        connection.close()
+    else:
+        _pooled_connections()[key] = connection
+
+
+def _http_request(
+    method: str,
+    url: str,
+    body: bytes | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float = 30,
+) -> tuple[int, bytes]:
+    """Send an HTTP request over a pooled keep-alive connection.
+
+    Args:
+        method: HTTP method
+        url: Absolute http(s) URL
+        body: Request body (optional)
+        headers: Request headers (optional)
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Tuple of (status code, response body)
+
+    Raises:
+        ValueError: If the URL scheme is not http or https
+        OSError: If the request fails
+        http.client.HTTPException: If the response is malformed
+    """
+    key, connection, response = _open_response(method, url, body, headers, timeout)
+    try:
+        data = response.read()
+    except BaseException:
+        connection.close()
+        raise
+    _release_connection(key, connection, response)
+    return response.status, data
+
+
+def _http_stream_lines(
+    method: str,
+    url: str,
+    body: bytes | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float = 30,
+) -> Iterator[bytes]:
+    """Send an HTTP request and yield the response body line by line.
+
+    Lines are yielded as soon as they arrive, which suits newline-delimited
+    JSON streams. The connection is returned to the pool only if the body
+    was consumed to the end.
+
+    Args:
+        method: HTTP method
+        url: Absolute http(s) URL
+        body: Request body (optional)
+        headers: Request headers (optional)
+        timeout: Socket timeout in seconds
+
+    Yields:
+        Raw response lines, including line terminators
+
+    Raises:
+        ValueError: If the URL scheme is not http or https
+        OSError: If the request fails
+        http.client.HTTPException: If the response is malformed or the
+            status is not 200
+    """
+    key, connection, response = _open_response(method, url, body, headers, timeout)
+    try:
+        if response.status != 200:
+            detail = response.read()[:200]
+            raise http.client.HTTPException(f"HTTP {response.status}: {detail!r}")
+        while line := response.readline():
+            yield line
+        # readline() leaves a length-delimited body open at EOF; read()
+        # marks it complete so the connection can be pooled
+        response.read()
+    except BaseException:
+        connection.close()
+        raise
+    _release_connection(key, connection, response)
+
 
 class LLMConfig:
     """Configuration for LLM service.
@@ -25,6 +343,8 @@ class LLMConfig:
         max_tokens: Maximum tokens to generate
         api_key: API key for provider (if needed)
         base_url: Base URL for provider (if needed)
+        enable_semantic_cache: Serve near-duplicate prompts from cache
+            (requires an embedder on the LLMService)
     """
 
     def __init__(
@@ -35,6 +355,7 @@ class LLMConfig:
         max_tokens: int = 500,
         api_key: str | None = None,
         base_url: str | None = None,
+        enable_semantic_cache: bool = False,
     ) -> None:
         """Initialize LLM configuration.
 
@@ -45,6 +366,7 @@ class LLMConfig:
             max_tokens: Maximum tokens
             api_key: API key (optional)
             base_url: Base URL (optional)
+            enable_semantic_cache: Enable the semantic response cache
         """
         self.provider = provider
         self.model = model
@@ -52,6 +374,7 @@ class LLMConfig:
         self.max_tokens = max_tokens
         self.api_key = api_key
         self.base_url = base_url
+        self.enable_semantic_cache = enable_semantic_cache
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary.
@@ -66,6 +389,7 @@ class LLMConfig:
             "max_tokens": self.max_tokens,
             "api_key": "***" if self.api_key else None,
             "base_url": self.base_url,
+            "enable_semantic_cache": self.enable_semantic_cache,
         }
 
 
@@ -131,6 +455,140 @@ class LLMResult:
         return f"LLMResult(provider={self.provider}, model={self.model}, response_length={len(self.response)})"
 
 
+Embedder = Callable[[str], Sequence[float]]
+
+
+class SemanticCache:
+    """Response cache that matches prompts by embedding similarity.
+
+    Prompts are embedded with a caller-supplied function and compared by
+    cosine similarity, so rephrasings and whitespace differences can be
+    served without another LLM round-trip. Entries are scoped so that a
+    response is only reused under the same LLM configuration.
+
+    Example:
+        >>> cache = SemanticCache(model.encode, threshold=0.95)
+        >>> cache.store("ollama|llama2", "Name a sword", "Dawnbreaker")
+        >>> cache.lookup("ollama|llama2", "Name a  sword")
+        'Dawnbreaker'
+    """
+
+    def __init__(
+        self, embedder: Embedder, threshold: float = 0.95, max_entries: int = 256
+    ) -> None:
+        """Initialize the semantic cache.
+
+        Args:
+            embedder: Function mapping text to an embedding vector
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached responses
+
+        Raises:
+            ValueError: If threshold or max_entries are out of range
+        """
+        if not -1.0 <= threshold <= 1.0:
+            raise ValueError("Threshold must be between -1.0 and 1.0")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # (scope, unit-length embedding, response), oldest first
+        self._entries: list[tuple[str, tuple[float, ...], str]] = []
+        self._lock = threading.Lock()
+
+    def _embed(self, text: str) -> tuple[float, ...]:
+        """Embed text and normalize it to unit length.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length embedding (all zeros for a zero vector)
+        """
+        vector = tuple(float(x) for x in self.embedder(text))
+        norm = math.sqrt(math.fsum(x * x for x in vector))
+        if norm == 0.0:
+            return vector
+        return tuple(x / norm for x in vector)
+
+    def lookup(self, scope: str, prompt: str) -> str | None:
+        """Find the cached response for the most similar prompt.
+
+        Args:
+            scope: Configuration scope the response must belong to
+            prompt: Prompt text
+
+        Returns:
+            Cached response, or None if nothing is similar enough
+        """
+        query = self._embed(prompt)
+        with self._lock:
+            entries = list(self._entries)
+
+        best_score = self.threshold
+        best_response: str | None = None
+        for entry_scope, embedding, response in entries:
+            if entry_scope != scope or len(embedding) != len(query):
+                continue
+            score = math.fsum(a * b for a, b in zip(embedding, query))
+            if score >= best_score:
+                best_score = score
+                best_response = response
+        return best_response
+
+    def store(self, scope: str, prompt: str, response: str) -> None:
+        """Add a prompt/response pair, evicting the oldest entry if full.
+
+        Args:
+            scope: Configuration scope of the response
+            prompt: Prompt text
+            response: Response text
+        """
+        embedding = self._embed(prompt)
+        with self._lock:
+            self._entries.append((scope, embedding, response))
+            if len(self._entries) > self.max_entries:
+                del self._entries[0]
+
+    def clear(self) -> None:
+        """Discard all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+
+def _batch_variables(
+    prompts: list[str],
+    variables_list: list[dict[str, Any] | None] | None,
+    concurrency: int,
+) -> list[dict[str, Any] | None]:
+    """Validate batch arguments and align variables with prompts.
+
+    Args:
+        prompts: Prompt texts to execute
+        variables_list: Per-prompt variables, aligned with prompts
+        concurrency: Maximum number of prompts in flight at once
+
+    Returns:
+        Per-prompt variables, one entry per prompt
+
+    Raises:
+        ValueError: If concurrency is below 1 or the lists differ in length
+    """
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+    if variables_list is None:
+        return [None] * len(prompts)
+    if len(variables_list) != len(prompts):
+        raise ValueError("variables_list must have one entry per prompt")
+    return variables_list
+
+
 class LLMService:
     """Service for LLM prompt execution.
 
@@ -145,26 +603,46 @@ class LLMService:
         >>> print(result.response)
     """
 
-    def __init__(self, config: LLMConfig | None = None) -> None:
+    def __init__(
+        self, config: LLMConfig | None = None, embedder: Embedder | None = None
+    ) -> None:
         """Initialize the LLM service.
 
         Args:
             config: LLM configuration (defaults to mock provider)
+            embedder: Text embedding function used by the semantic cache
+
+        Raises:
+            ValueError: If the semantic cache is enabled without an embedder
         """
         self.config = config or LLMConfig()
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.semantic_cache = SemanticCache(embedder) if embedder else None
+        self._check_semantic_cache(self.config)
         logger.info(
             f"LLMService initialized with provider: {self.config.provider}, "
             f"model: {self.config.model}"
         )
 
     def execute_prompt(
-        self, prompt: str, variables: dict[str, Any] | None = None
+        self,
+        prompt: str,
+        variables: dict[str, Any] | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
     ) -> LLMResult:
         """Execute an LLM prompt with variable substitution.
 
+        Generation time grows with the number of tokens produced, so short
+        outputs (names, single words) should pass a tight max_tokens and
+        leave the configured budget for long descriptions.
+
         Args:
             prompt: Prompt text (may contain {variable} placeholders)
             variables: Dictionary of variables for substitution
+            max_tokens: Token budget for this call (defaults to config)
+            temperature: Temperature for this call (defaults to config)
 
         Returns:
             LLMResult containing response and metadata
@@ -178,9 +656,11 @@ class LLMService:
             ...     "Generate a {item_type} for level {level}",
             ...     {"item_type": "sword", "level": 5}
             ... )
+            >>> name = service.execute_prompt("Name a tavern", max_tokens=10)
         """
         if not prompt:
             raise ValueError("Prompt cannot be empty")
+        max_tokens, temperature = self._generation_settings(max_tokens, temperature)
 
         prompt = prompt.strip()
         variables = variables or {}
@@ -188,6 +668,12 @@ class LLMService:
         # Substitute variables in prompt
         substituted_prompt = self._substitute_variables(prompt, variables)
 
+        scope = self._cache_scope(max_tokens, temperature)
+        cache_key = self._cache_key(substituted_prompt, scope, temperature)
+        cached_result = self._cached_result(substituted_prompt, cache_key, scope)
+        if cached_result is not None:
+            return cached_result
+
         logger.debug(f"Executing prompt: {substituted_prompt[:100]}...")
 
         try:
@@ -195,7 +681,9 @@ class LLMService:
             if self.config.provider == "mock":
                 response = self._execute_mock(substituted_prompt)
             elif self.config.provider == "ollama":
-                response = self._execute_ollama(substituted_prompt)
+                response = self._execute_ollama(
+                    substituted_prompt, max_tokens, temperature
+                )
             elif self.config.provider == "openai":
                 response = self._execute_openai(substituted_prompt)
             else:
@@ -209,6 +697,11 @@ class LLMService:
             )
 
             logger.info(f"LLM execution successful: {len(response)} chars generated")
+            if cache_key is not None:
+                self._store_cached(cache_key, response)
+                semantic_cache = self._active_semantic_cache()
+                if semantic_cache is not None:
+                    semantic_cache.store(scope, substituted_prompt, response)
             return result
 
         except Exception as e:
@@ -216,6 +709,345 @@ class LLMService:
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def execute_prompts(
+        self,
+        prompts: list[str],
+        variables_list: list[dict[str, Any] | None] | None = None,
+        concurrency: int = 8,
+    ) -> list[LLMResult]:
+        """Execute several prompts concurrently from synchronous code.
+
+        Requests are issued from a thread pool so their network waits
+        overlap. Ollama may still serialize generation on the GPU, but
+        request transfer and prompt tokenization overlap with decoding.
+
+        Args:
+            prompts: Prompt texts to execute
+            variables_list: Per-prompt variables, aligned with prompts
+            concurrency: Maximum number of prompts in flight at once
+
+        Returns:
+            LLMResults in the same order as prompts
+
+        Raises:
+            ValueError: If arguments are invalid or any prompt is invalid
+            RuntimeError: If any LLM execution fails
+        """
+        variables_list = _batch_variables(prompts, variables_list, concurrency)
+        if not prompts:
+            return []
+
+        workers = min(concurrency, len(prompts))
+        logger.debug(f"Executing {len(prompts)} prompts with {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.execute_prompt, prompts, variables_list))
+
+    async def aexecute_prompt(
+        self,
+        prompt: str,
+        variables: dict[str, Any] | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> LLMResult:
+        """Execute an LLM prompt without blocking the event loop.
+
+        The blocking provider call runs in a worker thread, so several
+        prompts awaited together overlap their network round-trips.
+
+        Args:
+            prompt: Prompt text (may contain {variable} placeholders)
+            variables: Dictionary of variables for substitution
+            max_tokens: Token budget for this call (defaults to config)
+            temperature: Temperature for this call (defaults to config)
+
+        Returns:
+            LLMResult containing response and metadata
+
+        Raises:
+            ValueError: If prompt is empty or variables are invalid
+            RuntimeError: If LLM execution fails
+        """
+        return await asyncio.to_thread(
+            self.execute_prompt, prompt, variables, max_tokens, temperature
+        )
+
+    async def aexecute_prompts(
+        self,
+        prompts: list[str],
+        variables_list: list[dict[str, Any] | None] | None = None,
+        concurrency: int = 8,
+    ) -> list[LLMResult]:
+        """Execute several prompts concurrently.
+
+        Args:
+            prompts: Prompt texts to execute
+            variables_list: Per-prompt variables, aligned with prompts
+            concurrency: Maximum number of prompts in flight at once
+
+        Returns:
+            LLMResults in the same order as prompts
+
+        Raises:
+            ValueError: If arguments are invalid or any prompt is invalid
+            RuntimeError: If any LLM execution fails
+
+        Example:
+            >>> results = asyncio.run(
+            ...     service.aexecute_prompts(["Name a sword", "Name a shield"])
+            ... )
+        """
+        variables_list = _batch_variables(prompts, variables_list, concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(prompt: str, variables: dict[str, Any] | None) -> LLMResult:
+            async with semaphore:
+                return await self.aexecute_prompt(prompt, variables)
+
+        logger.debug(f"Executing {len(prompts)} prompts with concurrency {concurrency}")
+        return list(
+            await asyncio.gather(
+                *(
+                    bounded(prompt, variables)
+                    for prompt, variables in zip(prompts, variables_list)
+                )
+            )
+        )
+
+    def _generation_settings(
+        self, max_tokens: int | None, temperature: float | None
+    ) -> tuple[int, float]:
+        """Apply per-call overrides to the configured generation settings.
+
+        Args:
+            max_tokens: Token budget override, or None for the config value
+            temperature: Temperature override, or None for the config value
+
+        Returns:
+            Tuple of (max_tokens, temperature) to generate with
+
+        Raises:
+            ValueError: If max_tokens is not positive
+        """
+        if max_tokens is None:
+            max_tokens = self.config.max_tokens
+        elif max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        if temperature is None:
+            temperature = self.config.temperature
+        return max_tokens, temperature
+
+    def _cache_key(
+        self, substituted_prompt: str, scope: str, temperature: float
+    ) -> str | None:
+        """Build the response cache key for a prompt.
+
+        Args:
+            substituted_prompt: Prompt text after variable substitution
+            scope: Scope from _cache_scope
+            temperature: Temperature the prompt is generated with
+
+        Returns:
+            Hex digest identifying the request, or None if the
+            temperature makes the response non-deterministic
+        """
+        if temperature > _CACHEABLE_MAX_TEMPERATURE:
+            return None
+        raw = f"{scope}|{substituted_prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cached_result(
+        self, substituted_prompt: str, cache_key: str | None, scope: str
+    ) -> LLMResult | None:
+        """Look up a prompt in the exact-match and semantic caches.
+
+        Args:
+            substituted_prompt: Prompt text after variable substitution
+            cache_key: Key from _cache_key (None disables caching)
+            scope: Scope from _cache_scope
+
+        Returns:
+            Cached LLMResult, or None on a miss
+        """
+        if cache_key is None:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+        semantic_cache = self._active_semantic_cache()
+        if cached is None and semantic_cache is not None:
+            cached = semantic_cache.lookup(scope, substituted_prompt)
+        if cached is None:
+            return None
+
+        logger.debug("LLM response served from cache")
+        return LLMResult(
+            prompt=substituted_prompt,
+            response=cached,
+            provider=self.config.provider,
+            model=self.config.model,
+            metadata={"cached": True},
+        )
+
+    def _cache_scope(self, max_tokens: int, temperature: float) -> str:
+        """Describe the settings that determine a cached response.
+
+        Args:
+            max_tokens: Token budget the prompt is generated with
+            temperature: Temperature the prompt is generated with
+
+        Returns:
+            Scope string for the current configuration and settings
+        """
+        config = self.config
+        return f"{config.provider}|{config.model}|{temperature}|{max_tokens}"
+
+    def _active_semantic_cache(self) -> SemanticCache | None:
+        """Get the semantic cache if the current config enables it.
+
+        Returns:
+            The semantic cache, or None if disabled
+        """
+        if self.config.enable_semantic_cache:
+            return self.semantic_cache
+        return None
+
+    def _check_semantic_cache(self, config: LLMConfig) -> None:
+        """Validate that a config enabling the semantic cache can be served.
+
+        Args:
+            config: Configuration to validate
+
+        Raises:
+            ValueError: If the semantic cache is enabled without an embedder
+        """
+        if config.enable_semantic_cache and self.semantic_cache is None:
+            raise ValueError(
+                "enable_semantic_cache requires an embedder; "
+                "pass embedder= when creating the LLMService"
+            )
+
+    def _store_cached(self, cache_key: str, response: str) -> None:
+        """Store a response in the LRU cache, evicting the oldest entry.
+
+        Args:
+            cache_key: Key from _cache_key
+            response: Response text to cache
+        """
+        with self._cache_lock:
+            self._cache[cache_key] = response
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > _RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Discard all cached LLM responses."""
+        with self._cache_lock:
+            self._cache.clear()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+
+    async def abatch_with_cache(
+        self, prompts: list[str], concurrency: int = 8
+    ) -> list[LLMResult]:
+        """Execute a batch of prompts, sending each distinct miss only once.
+
+        Duplicate prompts are collapsed, cached responses are answered
+        without leaving the event loop, and only the remaining prompts are
+        executed concurrently. Duplicates share a single LLMResult.
+
+        Args:
+            prompts: Prompt texts to execute (no variable substitution)
+            concurrency: Maximum number of prompts in flight at once
+
+        Returns:
+            LLMResults in the same order as prompts
+
+        Raises:
+            ValueError: If any prompt is empty or concurrency is invalid
+            RuntimeError: If any LLM execution fails
+        """
+        if any(not prompt for prompt in prompts):
+            raise ValueError("Prompt cannot be empty")
+
+        max_tokens, temperature = self._generation_settings(None, None)
+        scope = self._cache_scope(max_tokens, temperature)
+        resolved: dict[str, LLMResult] = {}
+        misses: list[str] = []
+        for prompt in dict.fromkeys(prompts):
+            substituted_prompt = self._substitute_variables(prompt.strip(), {})
+            cached = self._cached_result(
+                substituted_prompt,
+                self._cache_key(substituted_prompt, scope, temperature),
+                scope,
+            )
+            if cached is None:
+                misses.append(prompt)
+            else:
+                resolved[prompt] = cached
+
+        logger.debug(
+            f"Batch of {len(prompts)} prompts: "
+            f"{len(resolved) + len(misses)} distinct, {len(misses)} to execute"
+        )
+        if misses:
+            executed = await self.aexecute_prompts(misses, concurrency=concurrency)
+            resolved.update(zip(misses, executed))
+
+        return [resolved[prompt] for prompt in prompts]
+
+    def stream_prompt(
+        self,
+        prompt: str,
+        variables: dict[str, Any] | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> Iterator[str]:
+        """Execute an LLM prompt, yielding the response as it is generated.
+
+        Streaming bypasses the response caches. Providers without native
+        streaming yield their whole response as a single chunk.
+
+        Args:
+            prompt: Prompt text (may contain {variable} placeholders)
+            variables: Dictionary of variables for substitution
+            max_tokens: Token budget for this call (defaults to config)
+            temperature: Temperature for this call (defaults to config)
+
+        Yields:
+            Response text chunks in generation order
+
+        Raises:
+            ValueError: If prompt is empty
+            RuntimeError: If LLM execution fails
+
+        Example:
+            >>> for chunk in service.stream_prompt("Describe a tavern"):
+            ...     print(chunk, end="", flush=True)
+        """
+        if not prompt:
+            raise ValueError("Prompt cannot be empty")
+        max_tokens, temperature = self._generation_settings(max_tokens, temperature)
+
+        substituted_prompt = self._substitute_variables(prompt.strip(), variables or {})
+        logger.debug(f"Streaming prompt: {substituted_prompt[:100]}...")
+
+        try:
+            if self.config.provider == "mock":
+                yield self._execute_mock(substituted_prompt)
+            elif self.config.provider == "ollama":
+                yield from self._stream_ollama(
+                    substituted_prompt, max_tokens, temperature
+                )
+            elif self.config.provider == "openai":
+                yield self._execute_openai(substituted_prompt)
+            else:
+                raise ValueError(f"Unsupported provider: {self.config.provider}")
+        except Exception as e:
+            error_msg = f"LLM streaming failed: {e}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
     def _substitute_variables(self, prompt: str, variables: dict[str, Any]) -> str:
         """Substitute variables in prompt.
 
@@ -227,7 +1059,7 @@ class LLMService:
             Prompt with variables substituted
         """
         try:
-            return prompt.format(**variables)
+            return format_prompt(prompt, variables)
         except KeyError as e:
             logger.warning(f"Variable not found in prompt: {e}")
             # Return original prompt if substitution fails
@@ -243,18 +1075,20 @@ class LLMService:
             Mock response
         """
         # Generate a deterministic mock response based on prompt
-        word_count = len(prompt.split())
+        word_count = _count_words(prompt)
         return (
             f"[MOCK RESPONSE] This is a mock LLM response. "
             f"The prompt contained {word_count} words. "
             f"In a real implementation, this would be generated by {self.config.model}."
         )
 
-    def _execute_ollama(self, prompt: str) -> str:
+    def _execute_ollama(self, prompt: str, max_tokens: int, temperature: float) -> str:
         """Execute Ollama LLM.
 
         Args:
             prompt: Prompt text
+            max_tokens: Maximum tokens to generate
+            temperature: Generation temperature
 
         Returns:
             Ollama response
@@ -262,57 +1096,106 @@ class LLMService:
         Raises:
             RuntimeError: If Ollama execution fails
         """
-        import json
-
         try:
-            # Prepare request to Ollama API
-            base_url = self.config.base_url or "http://localhost:11434"
-            url = f"{base_url}/api/generate"
-
-            data = {
-                "model": self.config.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": self.config.temperature,
-                    "num_predict": self.config.max_tokens,
-                },
-            }
-
-            # Make request to Ollama
-            req = urllib.request.Request(
-                url,
-                data=json.dumps(data).encode("utf-8"),
-                headers={"Content-Type": "application/json"},
-            )
-
-            with urllib.request.urlopen(req, timeout=30) as response:  # nosec B310
-                result = json.loads(response.read().decode("utf-8"))
-                response_text: str = result.get("response", "")
-                return response_text
+            # Non-streaming calls are buffered streams
+            return "".join(self._stream_ollama(prompt, max_tokens, temperature))
 
         except Exception as e:
             error_msg = f"Ollama execution failed: {e}"
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def _stream_ollama(
+        self, prompt: str, max_tokens: int, temperature: float
+    ) -> Iterator[str]:
+        """Stream an Ollama generation as response chunks.
+
+        Args:
+            prompt: Prompt text
+            max_tokens: Maximum tokens to generate
+            temperature: Generation temperature
+
+        Yields:
+            Response text chunks in generation order
+
+        Raises:
+            RuntimeError: If Ollama reports an error
+            OSError: If the request fails
+            http.client.HTTPException: If the response is not a 200
+        """
+        url, data, headers = self._build_ollama_payload(prompt, max_tokens, temperature)
+        lines = _http_stream_lines("POST", url, _json_dumps(data), headers, timeout=30)
+        for line in lines:
+            if not line.strip():
+                continue
+            chunk = _json_loads(line)
+            if "error" in chunk:
+                raise RuntimeError(chunk["error"])
+            text: str = chunk.get("response", "")
+            if text:
+                yield text
+            if chunk.get("done"):
+                # Drain the stream so the connection can be reused
+                for _ in lines:
+                    pass
+                return
+
+    def _build_ollama_payload(
+        self, prompt: str, max_tokens: int, temperature: float
+    ) -> tuple[str, dict[str, Any], dict[str, str]]:
+        """Build the streaming Ollama generate request for a prompt.
+
+        Args:
+            prompt: Prompt text
+            max_tokens: Maximum tokens to generate (num_predict)
+            temperature: Generation temperature
+
+        Returns:
+            Tuple of (url, JSON payload, headers)
+        """
+        base_url = self.config.base_url or _DEFAULT_OLLAMA_URL
+        data = {
+            "model": self.config.model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        }
+        return f"{base_url}/api/generate", data, _JSON_HEADERS
+
     @staticmethod
-    def is_ollama_available(base_url: str = "http://localhost:11434") -> bool:
+    def is_ollama_available(
+        base_url: str = _DEFAULT_OLLAMA_URL, ttl: float = 5.0
+    ) -> bool:
         """Check if Ollama is available.
 
+        Results are cached per base URL so that polling callers do not
+        send a request on every check.
+
         Args:
             base_url: Ollama base URL
+            ttl: Seconds a previous result stays valid (0 forces a check)
 
         Returns:
             True if Ollama is running and accessible
         """
+        now = time.monotonic()
+        with _AVAILABILITY_CACHE_LOCK:
+            entry = _AVAILABILITY_CACHE.get(base_url)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+
         try:
-            req = urllib.request.Request(f"{base_url}/api/tags")
-            with urllib.request.urlopen(req, timeout=2) as response:  # nosec B310
-                is_available: bool = response.status == 200
-                return is_available
-        except (urllib.error.URLError, TimeoutError):
-            return False
+            status, _ = _http_request("GET", f"{base_url}/api/tags", timeout=2)
+            is_available = status == 200
+        except (OSError, ValueError, http.client.HTTPException):
+            is_available = False
+
+        with _AVAILABILITY_CACHE_LOCK:
+            _AVAILABILITY_CACHE[base_url] = (now, is_available)
+        return is_available
 
     def _execute_openai(self, prompt: str) -> str:
         """Execute OpenAI LLM.
@@ -344,7 +1227,11 @@ class LLMService:
 
         Args:
             config: New configuration
+
+        Raises:
+            ValueError: If the semantic cache is enabled without an embedder
         """
+        self._check_semantic_cache(config)
         logger.info(
             f"Updating LLM config: provider={config.provider}, model={config.model}"
         )
@@ -7,6 +7,8 @@ to handle name generation operations in GRIMOIRE flows.
 from __future__ import annotations
 
 import random
+import threading
+from collections import deque
 
 from grimoire_logging import get_logger
 from wyrdbound_rng import FantasyNameSegmenter, Generator, JapaneseNameSegmenter
@@ -30,6 +32,15 @@ _BUILTIN_NAME_LISTS = {
     "warhammer40k-space-marine-names": "warhammer40k-space-marine-names",
 }
 
+_BUILTIN_NAME_LIST_KEYS: tuple[str, ...] = tuple(_BUILTIN_NAME_LISTS)
+
+# Legacy name type and style values (wyrdbound-rng ignores both)
+_SUPPORTED_TYPES: tuple[str, ...] = ("character", "place", "first", "last")
+_SUPPORTED_STYLES: tuple[str, ...] = ("fantasy",)
+
+# Upper bound on names generated ahead by one generate_name() refill
+_MAX_PREFETCH = 32
+
 # Supported segmenters
 _SEGMENTERS = {
     "fantasy": FantasyNameSegmenter,
@@ -64,8 +75,9 @@ class NameService:
             segmenter: Segmenter type ("fantasy" or "japanese")
             seed: Optional random seed for deterministic generation
         """
-        if seed is not None:
-            random.seed(seed)
+        # Per-instance random stream: seeding never touches the global
+        # random module, so services can run side by side in threads
+        self._rng = random.Random(seed)  # nosec B311 - names, not cryptography
 
         # Get segmenter class
         segmenter_class = _SEGMENTERS.get(segmenter.lower())
@@ -77,9 +89,17 @@ class NameService:
 
         # Create generator with built-in name list
         try:
-            self.generator = Generator(name_list, segmenter=segmenter_class())
+            self.generator = Generator(
+                name_list, segmenter=segmenter_class(), rng=self._rng
+            )
             self.name_list = name_list
             self.segmenter = segmenter
+            # Names generated ahead for generate_name(); refills double in
+            # size (up to _MAX_PREFETCH) while the same arguments are reused
+            self._buffer: deque[str] = deque()
+            self._buffer_key: tuple[int, str] | None = None
+            self._prefetch = 1
+            self._buffer_lock = threading.Lock()
             logger.info(
                 f"NameService initialized with {name_list} using {segmenter} segmenter"
             )
@@ -98,6 +118,9 @@ class NameService:
     ) -> str:
         """Generate a name using wyrdbound-rng.
 
+        Repeated calls with the same max_length and algorithm are served
+        from a prefetch buffer filled by the generator's batch API.
+
         Args:
             name_type: Type of name (currently ignored, uses generator's corpus)
             style: Style of name (currently ignored, uses generator's corpus)
@@ -119,11 +142,23 @@ class NameService:
             f"Generating name with max_length={max_length}, algorithm={algorithm}"
         )
 
+        key = (max_length, algorithm)
         try:
-            result = self.generator.generate_name(
-                max_len=max_length, algorithm=algorithm
-            )
-            name = str(result.name)
+            # Refill and pop as one step: flow runs may share a service
+            with self._buffer_lock:
+                if key != self._buffer_key:
+                    self._buffer.clear()
+                    self._buffer_key = key
+                    self._prefetch = 1
+                if not self._buffer:
+                    results = self.generator.generate(
+                        n=self._prefetch, max_chars=max_length, algorithm=algorithm
+                    )
+                    self._buffer.extend(str(result.name) for result in results)
+                    self._prefetch = min(self._prefetch * 2, _MAX_PREFETCH)
+                if not self._buffer:
+                    raise RuntimeError("generator returned no names")
+                name = self._buffer.popleft()
             logger.info(f"Generated name: {name}")
             return name
         except Exception as e:
@@ -191,7 +226,7 @@ class NameService:
         Returns:
             List of supported name type strings
         """
-        return ["character", "place", "first", "last"]
+        return list(_SUPPORTED_TYPES)
 
     def get_supported_styles(self) -> list[str]:
         """Get list of supported name styles.
@@ -202,7 +237,7 @@ class NameService:
         Returns:
             List of supported style strings
         """
-        return ["fantasy"]
+        return list(_SUPPORTED_STYLES)
 
     def get_available_name_lists(self) -> list[str]:
         """Get list of available built-in name lists.
@@ -210,7 +245,7 @@ class NameService:
         Returns:
             List of built-in name list identifiers
         """
-        return list(_BUILTIN_NAME_LISTS.keys())
+        return list(_BUILTIN_NAME_LIST_KEYS)
 
     def name_exists_in_corpus(self, name: str) -> bool:
         """Check if a name exists in the source corpus.
@@ -9,20 +9,108 @@ if it is not available, following the principle of explicit errors over fallback
 
 from __future__ import annotations
 
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from grimoire_logging import get_logger
 from grimoire_model import (  # Explicit import - fail fast if not available
+    ModelDefinition,
     create_model,
     get_default_registry,
     register_model,
     validate_model_data,
 )
 
-from ..models.grimoire_definitions import CompleteSystem, FlowDefinition
+from ..models.grimoire_definitions import (
+    CompleteSystem,
+    FlowDefinition,
+    FlowInputOutput,
+    FlowVariable,
+)
 
+# Logs issued per flow entry or per object pass %-style arguments so the
+# message is only formatted when its level is enabled
 logger = get_logger(__name__)
 
+# Common string representations of a true boolean
+_BOOL_TRUE_STRINGS = frozenset(("true", "yes", "1", "on"))
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a value to bool, accepting common string representations.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        Converted boolean
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in _BOOL_TRUE_STRINGS
+    return bool(value)
+
+
+# Converter for each supported primitive flow type
+_PRIMITIVE_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": _to_bool,
+}
+_PRIMITIVE_TYPES: frozenset[str] = frozenset(_PRIMITIVE_CONVERTERS)
+
+
+def _with_model(data: dict[str, Any], model_type: str) -> dict[str, Any]:
+    """Get object data tagged with a model type.
+
+    Data that already names its model is returned as-is. Otherwise a
+    tagged copy is made, since the dictionary belongs to the caller.
+
+    Args:
+        data: Object data dictionary
+        model_type: Model type to use when data has no 'model' field
+
+    Returns:
+        Dictionary with a 'model' field
+    """
+    if "model" in data:
+        return data
+    return {"model": model_type, **data}
+
+
+@contextmanager
+def _log_on_error(message: str) -> Iterator[None]:
+    """Log any exception raised in the block and re-raise it as RuntimeError.
+
+    Args:
+        message: Prefix for the error message
+
+    Raises:
+        RuntimeError: Wrapping any exception raised in the block
+    """
+    try:
+        yield
+    except Exception as e:
+        error_msg = f"{message}: {e}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg) from e
+
+
+# How a flow entry's value is instantiated, decided once per entry type
+_DISPATCH_PRIMITIVE = 0
+_DISPATCH_MODEL = 1
+_DISPATCH_AS_IS = 2
+
+# Precomputed flow entry: (id, type, dispatch, required, validate)
+_PlanEntry = tuple[str, str, int, bool, bool]
+
+# A flow's plans: (weak reference to the flow, plans by entry kind)
+_FlowSchedule = tuple[weakref.ref[FlowDefinition], dict[str, tuple[_PlanEntry, ...]]]
+
 
 class ObjectInstantiationService:
     """Service for instantiating GRIMOIRE game objects using grimoire-model.
@@ -46,30 +134,32 @@ class ObjectInstantiationService:
             RuntimeError: If model registration fails
         """
         self.system = system
-        try:
+        # Instantiation plans for each flow, keyed by id(flow_def)
+        self._flow_schedules: dict[int, _FlowSchedule] = {}
+        with _log_on_error("Failed to initialize model registry"):
             # Get the model registry
-            self.model_registry = get_default_registry()
+            registry = get_default_registry()
+            self.model_registry = registry
 
-            # Register all models from the system (they're already grimoire-model objects)
-            for _model_id, model_def in system.models.items():
-                register_model(system.system.id, model_def)
+            # Register all models from the system (they're already grimoire-model
+            # objects). grimoire-model has no bulk API, so pass the registry
+            # explicitly to skip its per-call default registry lookup.
+            namespace = system.system.id
+            for model_def in system.models.values():
+                register_model(namespace, model_def, registry)
 
             logger.info(
                 f"Initialized ObjectInstantiationService for system: {system.system.id}"
             )
-        except Exception as e:
-            error_msg = f"Failed to initialize model registry: {e}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
 
-    def _determine_model_type(self, data: dict[str, Any]) -> str:
-        """Determine the model type from object data.
+    def _resolve_model(self, data: dict[str, Any]) -> tuple[str, ModelDefinition]:
+        """Determine the model type and definition from object data.
 
         Args:
             data: Object data dictionary
 
         Returns:
-            Model type identifier
+            Tuple of (model type identifier, model definition)
 
         Raises:
             ValueError: If model type cannot be determined
@@ -81,11 +171,12 @@ class ObjectInstantiationService:
         if not isinstance(model_type, str):
             raise ValueError(f"Model field must be a string, got {type(model_type)}")
 
-        if model_type not in self.system.models:
+        model_def = self.system.models.get(model_type)
+        if model_def is None:
             raise ValueError(f"Unknown model type: {model_type}")
 
-        logger.debug(f"Determined model type: {model_type}")
-        return model_type
+        logger.debug("Determined model type: %s", model_type)
+        return model_type, model_def
 
     def create_object(self, data: dict[str, Any]) -> Any:
         """Create a game object from data using the appropriate model.
@@ -103,14 +194,51 @@ class ObjectInstantiationService:
         if not isinstance(data, dict):
             raise ValueError("Object data must be a dictionary")
 
-        model_type = self._determine_model_type(data)
-        logger.debug(f"Creating {model_type} object")
+        model_type, model_def = self._resolve_model(data)
+        return self._build_object(model_type, model_def, data)
+
+    def _create_object_unchecked(self, model_type: str, data: dict[str, Any]) -> Any:
+        """Create a game object for callers that already know the model type.
+
+        Skips the dictionary and 'model' field checks done by create_object.
+
+        Args:
+            model_type: Model type identifier
+            data: Object data dictionary
+
+        Returns:
+            Validated game object instance
+
+        Raises:
+            ValueError: If the model type is unknown
+            RuntimeError: If object creation fails
+        """
+        model_def = self.system.models.get(model_type)
+        if model_def is None:
+            raise ValueError(f"Unknown model type: {model_type}")
+        return self._build_object(model_type, model_def, data)
+
+    def _build_object(
+        self, model_type: str, model_def: ModelDefinition, data: dict[str, Any]
+    ) -> Any:
+        """Create a game object from an already resolved model definition.
+
+        Args:
+            model_type: Model type identifier
+            model_def: Model definition for model_type
+            data: Object data dictionary
+
+        Returns:
+            Validated game object instance
+
+        Raises:
+            RuntimeError: If object creation fails
+        """
+        logger.debug("Creating %s object", model_type)
 
         try:
-            # Get the model definition and create the object
-            model_def = self.system.models[model_type]
             game_object = create_model(model_def, data)
-            logger.info(f"Successfully created {model_type} object")
+            logger.info("Successfully created %s object", model_type)
             return game_object
         except Exception as e:
             error_msg = f"Failed to create {model_type} object: {e}"
@@ -126,8 +254,8 @@ class ObjectInstantiationService:
         Returns:
             Validated character object instance
         """
-        character_data = {"model": "character", **data}
-        return self.create_object(character_data)
+        character_data = _with_model(data, "character")
+        return self._create_object_unchecked(character_data["model"], character_data)
 
     def create_item(self, data: dict[str, Any]) -> Any:
         """Create an item object (backward compatibility method).
@@ -138,8 +266,8 @@ class ObjectInstantiationService:
         Returns:
             Validated item object instance
         """
-        item_data = {"model": "item", **data}
-        return self.create_object(item_data)
+        item_data = _with_model(data, "item")
+        return self._create_object_unchecked(item_data["model"], item_data)
 
     def validate_object(self, data: dict[str, Any]) -> tuple[bool, list[str]]:
         """Validate object data without creating an instance.
@@ -152,8 +280,7 @@ class ObjectInstantiationService:
         """
         logger.debug("Validating object data")
         try:
-            model_type = self._determine_model_type(data)
-            model_def = self.system.models[model_type]
+            _model_type, model_def = self._resolve_model(data)
             # Use grimoire-model's validation function
             errors = validate_model_data(data, model_def.attributes)
             if errors:
@@ -181,17 +308,13 @@ class ObjectInstantiationService:
             RuntimeError: If update fails
         """
         logger.debug("Updating game object")
-        try:
+        with _log_on_error("Failed to update game object"):
             # Use the GrimoireModel's update method
             game_object.update(data)
             # Validate after update
             game_object.validate()
             logger.info("Successfully updated game object")
             return game_object
-        except Exception as e:
-            error_msg = f"Failed to update game object: {e}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
 
     def instantiate_flow_input(
         self, flow_def: FlowDefinition, input_data: dict[str, Any]
@@ -210,52 +333,7 @@ class ObjectInstantiationService:
             RuntimeError: If instantiation fails
         """
         logger.debug(f"Instantiating flow inputs for flow: {flow_def.id}")
-        instantiated_inputs = {}
-
-        try:
-            for flow_input in flow_def.inputs:
-                input_id = flow_input.id
-                input_type = flow_input.type
-
-                # Check if required input is provided
-                if flow_input.required and input_id not in input_data:
-                    raise ValueError(f"Required input '{input_id}' not provided")
-
-                # Skip optional inputs that aren't provided
-                if input_id not in input_data:
-                    logger.debug(f"Optional input '{input_id}' not provided, skipping")
-                    continue
-
-                value = input_data[input_id]
-
-                # Handle primitive types directly
-                if input_type in ("str", "int", "float", "bool"):
-                    instantiated_inputs[input_id] = self.validate_primitive_type(
-                        value, input_type, f"input '{input_id}'"
-                    )
-                # Handle model types
-                elif input_type in self.system.models:
-                    # Ensure the value has the model type specified
-                    if isinstance(value, dict) and "model" not in value:
-                        value = {"model": input_type, **value}
-                    instantiated_inputs[input_id] = self.create_object(value)
-                else:
-                    # For other types, validate as-is but log a warning
-                    logger.warning(
-                        f"Unknown input type '{input_type}' for input '{input_id}', "
-                        "using value as-is"
-                    )
-                    instantiated_inputs[input_id] = value
-
-            logger.info(
-                f"Successfully instantiated {len(instantiated_inputs)} flow inputs"
-            )
-            return instantiated_inputs
-
-        except Exception as e:
-            error_msg = f"Failed to instantiate flow inputs: {e}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
+        return self._instantiate_entries(flow_def, input_data, "input")
 
     def instantiate_flow_output(
         self, flow_def: FlowDefinition, output_data: dict[str, Any]
@@ -273,53 +351,7 @@ class ObjectInstantiationService:
             RuntimeError: If instantiation fails
         """
         logger.debug(f"Instantiating flow outputs for flow: {flow_def.id}")
-        instantiated_outputs = {}
-
-        try:
-            for flow_output in flow_def.outputs:
-                output_id = flow_output.id
-                output_type = flow_output.type
-
-                # Skip outputs not present in data
-                if output_id not in output_data:
-                    logger.debug(f"Output '{output_id}' not present in data, skipping")
-                    continue
-
-                value = output_data[output_id]
-
-                # Handle primitive types directly
-                if output_type in ("str", "int", "float", "bool"):
-                    instantiated_outputs[output_id] = self.validate_primitive_type(
-                        value, output_type, f"output '{output_id}'"
-                    )
-                # Handle model types
-                elif output_type in self.system.models:
-                    # Ensure the value has the model type specified
-                    if isinstance(value, dict) and "model" not in value:
-                        value = {"model": output_type, **value}
-
-                    # Only validate if specified in flow definition
-                    if flow_output.validate:
-                        instantiated_outputs[output_id] = self.create_object(value)
-                    else:
-                        instantiated_outputs[output_id] = value
-                else:
-                    # For other types, use value as-is
-                    logger.debug(
-                        f"Using output type '{output_type}' for output '{output_id}' "
-                        "as-is"
-                    )
-                    instantiated_outputs[output_id] = value
-
-            logger.info(
-                f"Successfully instantiated {len(instantiated_outputs)} flow outputs"
-            )
-            return instantiated_outputs
-
-        except Exception as e:
-            error_msg = f"Failed to instantiate flow outputs: {e}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
+        return self._instantiate_entries(flow_def, output_data, "output")
 
     def instantiate_flow_variable(
         self, flow_def: FlowDefinition, variable_data: dict[str, Any]
@@ -337,53 +369,187 @@ class ObjectInstantiationService:
             RuntimeError: If instantiation fails
         """
         logger.debug(f"Instantiating flow variables for flow: {flow_def.id}")
-        instantiated_variables = {}
+        return self._instantiate_entries(flow_def, variable_data, "variable")
 
-        try:
-            for flow_var in flow_def.variables:
-                var_id = flow_var.id
-                var_type = flow_var.type
+    def _dispatch_kind(self, value_type: str) -> int:
+        """Classify a declared flow type for instantiation.
 
-                # Skip variables not present in data
-                if var_id not in variable_data:
-                    logger.debug(f"Variable '{var_id}' not present in data, skipping")
-                    continue
+        Args:
+            value_type: Declared primitive or model type
+
+        Returns:
+            One of the _DISPATCH_* constants
+        """
+        if value_type in _PRIMITIVE_TYPES:
+            return _DISPATCH_PRIMITIVE
+        if value_type in self.system.models:
+            return _DISPATCH_MODEL
+        return _DISPATCH_AS_IS
 
-                value = variable_data[var_id]
-
-                # Handle primitive types directly
-                if var_type in ("str", "int", "float", "bool"):
-                    instantiated_variables[var_id] = self.validate_primitive_type(
-                        value, var_type, f"variable '{var_id}'"
-                    )
-                # Handle model types
-                elif var_type in self.system.models:
-                    # Ensure the value has the model type specified
-                    if isinstance(value, dict) and "model" not in value:
-                        value = {"model": var_type, **value}
-
-                    # Only validate if specified in flow definition
-                    if flow_var.validate:
-                        instantiated_variables[var_id] = self.create_object(value)
-                    else:
-                        instantiated_variables[var_id] = value
-                else:
-                    # For other types, use value as-is
-                    logger.debug(
-                        f"Using variable type '{var_type}' for variable '{var_id}' "
-                        "as-is"
-                    )
-                    instantiated_variables[var_id] = value
+    def _flow_plan(self, flow_def: FlowDefinition, kind: str) -> tuple[_PlanEntry, ...]:
+        """Get the precomputed instantiation plan for a flow's entries.
 
-            logger.info(
-                f"Successfully instantiated {len(instantiated_variables)} flow variables"
+        The plans for a flow's inputs, outputs and variables are built
+        together on first use and reused for every later run of the flow.
+
+        Args:
+            flow_def: Flow definition
+            kind: Entry kind ("input", "output" or "variable")
+
+        Returns:
+            Tuple of (id, type, dispatch, required, validate) entries
+        """
+        schedule = self._flow_schedules.get(id(flow_def))
+        if schedule is None or schedule[0]() is not flow_def:
+            schedule = self._build_flow_schedule(flow_def)
+        return schedule[1][kind]
+
+    def _build_flow_schedule(self, flow_def: FlowDefinition) -> _FlowSchedule:
+        """Build and store the instantiation plans for a flow.
+
+        Inputs come from outside the flow, so they are held to a stricter
+        standard: required inputs must be present and model values are
+        always validated. Outputs and variables are only validated when
+        their definition asks for it.
+
+        Args:
+            flow_def: Flow definition
+
+        Returns:
+            Tuple of (weak reference to the flow, plans by entry kind)
+        """
+        dispatch_kind = self._dispatch_kind
+
+        def plan(
+            entries: Iterable[FlowInputOutput | FlowVariable], is_input: bool
+        ) -> tuple[_PlanEntry, ...]:
+            return tuple(
+                (
+                    entry.id,
+                    entry.type,
+                    dispatch_kind(entry.type),
+                    is_input and bool(getattr(entry, "required", None)),
+                    is_input or bool(entry.validate),
+                )
+                for entry in entries
             )
-            return instantiated_variables
 
-        except Exception as e:
-            error_msg = f"Failed to instantiate flow variables: {e}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
+        plans = {
+            "input": plan(flow_def.inputs, True),
+            "output": plan(flow_def.outputs, False),
+            "variable": plan(flow_def.variables, False),
+        }
+
+        # Hold the flow weakly so reloaded definitions are not kept alive;
+        # the callback drops the schedule when the flow is collected
+        key = id(flow_def)
+        schedules = self._flow_schedules
+        flow_ref = weakref.ref(flow_def, lambda _ref: schedules.pop(key, None))
+        schedule: _FlowSchedule = (flow_ref, plans)
+        schedules[key] = schedule
+        return schedule
+
+    def _instantiate_entries(
+        self, flow_def: FlowDefinition, data: dict[str, Any], kind: str
+    ) -> dict[str, Any]:
+        """Instantiate the values of a flow's typed entries.
+
+        The entries are walked through the flow's cached plan (see
+        _flow_plan). Unknown input types are logged as warnings.
+
+        Args:
+            flow_def: Flow definition
+            data: Dictionary mapping entry IDs to their values
+            kind: Entry kind ("input", "output" or "variable")
+
+        Returns:
+            Dictionary of instantiated values for the entries present
+
+        Raises:
+            RuntimeError: If a required input is missing or instantiation fails
+        """
+        warn_unknown = kind == "input"
+        instantiated: dict[str, Any] = {}
+        instantiate_value = self._instantiate_value
+
+        with _log_on_error(f"Failed to instantiate flow {kind}s"):
+            plan = self._flow_plan(flow_def, kind)
+            for entry_id, value_type, dispatch, required, validate in plan:
+                if entry_id not in data:
+                    if required:
+                        raise ValueError(f"Required input '{entry_id}' not provided")
+                    logger.debug("No value for %s '%s', skipping", kind, entry_id)
+                    continue
+
+                instantiated[entry_id] = instantiate_value(
+                    value_type,
+                    dispatch,
+                    entry_id,
+                    data[entry_id],
+                    kind,
+                    validate=validate,
+                    warn_unknown=warn_unknown,
+                )
+
+        logger.info(f"Successfully instantiated {len(instantiated)} flow {kind}s")
+        return instantiated
+
+    def _instantiate_value(
+        self,
+        value_type: str,
+        dispatch: int,
+        entry_id: str,
+        value: Any,
+        kind: str,
+        validate: bool,
+        warn_unknown: bool = False,
+    ) -> Any:
+        """Instantiate one flow value according to its declared type.
+
+        Args:
+            value_type: Declared primitive or model type
+            dispatch: Classification from _dispatch_kind
+            entry_id: Entry identifier (for messages)
+            value: Raw value
+            kind: Entry kind ("input", "output" or "variable")
+            validate: Whether model values are created as validated objects
+            warn_unknown: Log unknown types as warnings instead of debug
+
+        Returns:
+            Converted primitive, model object/data, or the value as-is
+
+        Raises:
+            ValueError: If a primitive value cannot be converted
+            RuntimeError: If model instantiation fails
+        """
+        # Handle primitive types directly
+        if dispatch == _DISPATCH_PRIMITIVE:
+            try:
+                return _PRIMITIVE_CONVERTERS[value_type](value)
+            except (ValueError, TypeError):
+                # Build the descriptive error only when conversion fails
+                return self.validate_primitive_type(
+                    value, value_type, f"{kind} '{entry_id}'"
+                )
+
+        # Handle model types
+        if dispatch == _DISPATCH_MODEL:
+            # Ensure the value has the model type specified
+            if isinstance(value, dict):
+                value = _with_model(value, value_type)
+            return self.create_object(value) if validate else value
+
+        # For other types, use value as-is
+        if warn_unknown:
+            logger.warning(
+                f"Unknown {kind} type '{value_type}' for {kind} '{entry_id}', "
+                "using value as-is"
+            )
+        else:
+            logger.debug(
+                "Using %s type '%s' for %s '%s' as-is", kind, value_type, kind, entry_id
+            )
+        return value
 
     def validate_primitive_type(
         self, value: Any, expected_type: str, context: str = "value"
@@ -404,22 +570,11 @@ class ObjectInstantiationService:
         Raises:
             ValueError: If value cannot be converted to expected type
         """
+        converter = _PRIMITIVE_CONVERTERS.get(expected_type)
         try:
-            if expected_type == "str":
-                return str(value)
-            elif expected_type == "int":
-                return int(value)
-            elif expected_type == "float":
-                return float(value)
-            elif expected_type == "bool":
-                # Handle common boolean representations
-                if isinstance(value, bool):
-                    return value
-                if isinstance(value, str):
-                    return value.lower() in ("true", "yes", "1", "on")
-                return bool(value)
-            else:
+            if converter is None:
                 raise ValueError(f"Unsupported primitive type: {expected_type}")
+            return converter(value)
         except (ValueError, TypeError) as e:
             raise ValueError(
                 f"Cannot convert {context} value '{value}' to type '{expected_type}': {e}"
@@ -7,6 +7,7 @@ that implements the StepExecutor protocol.
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from typing import Any, Callable, Protocol
 
 from grimoire_context import GrimoireContext
@@ -14,6 +15,67 @@ from grimoire_context import GrimoireContext
 from ...models.grimoire_definitions import FlowStep
 
 
+class ContextView(Mapping[str, Any]):
+    """Read-only mapping over the variables of a context.
+
+    Lookups go straight to the context, so handing a view to a callback
+    costs nothing until the callback reads from it. Use dict(view) for a
+    snapshot.
+    """
+
+    __slots__ = ("_context",)
+
+    def __init__(self, context: GrimoireContext) -> None:
+        """Initialize the view.
+
+        Args:
+            context: Context whose variables are exposed
+        """
+        self._context = context
+
+    def __getitem__(self, key: str) -> Any:
+        return self._context.chain_view[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._context.chain_view)
+
+    def __len__(self) -> int:
+        return len(self._context.chain_view)
+
+
+def set_step_values(
+    context: GrimoireContext,
+    step_namespace: str,
+    values: dict[str, Any],
+    aliases: dict[str, Any] | None = None,
+) -> GrimoireContext:
+    """Store values in a step namespace and set top-level aliases.
+
+    A single-level namespace (as created by the flow service) is written
+    together with the aliases in one context update. Dotted namespaces fall
+    back to one set_variable() per path.
+
+    Args:
+        context: Current execution context
+        step_namespace: Unique namespace for this step's data
+        values: Values to store under the step namespace
+        aliases: Optional top-level variables to set alongside
+
+    Returns:
+        Updated context
+    """
+    aliases = aliases or {}
+    if "." in step_namespace:
+        for key, value in values.items():
+            context = context.set_variable(f"{step_namespace}.{key}", value)
+        for key, value in aliases.items():
+            context = context.set_variable(key, value)
+        return context
+
+    namespace = {**context.get_variable(step_namespace, {}), **values}
+    return context.update({step_namespace: namespace, **aliases})
+
+
 class StepExecutor(Protocol):
     """Protocol for step executors.
 
@@ -26,7 +88,7 @@ class StepExecutor(Protocol):
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
     ) -> GrimoireContext:
         """Execute a flow step.
@@ -47,4 +109,4 @@ class StepExecutor(Protocol):
         ...
 
 
-__all__ = ["StepExecutor"]
+__all__ = ["ContextView", "StepExecutor", "set_step_values"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from grimoire_context import GrimoireContext
@@ -20,7 +21,7 @@ class CompletionStepExecutor:
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
     ) -> GrimoireContext:
         """Execute a completion step.
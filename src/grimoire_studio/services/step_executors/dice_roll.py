@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from grimoire_context import GrimoireContext
@@ -32,7 +33,7 @@ class DiceRollStepExecutor:
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
     ) -> GrimoireContext:
         """Execute a dice_roll step.
@@ -55,8 +56,10 @@ class DiceRollStepExecutor:
         if not roll_expr:
             raise FlowExecutionError(f"dice_roll step '{step.id}' missing 'roll' field")
 
-        # Resolve template in roll expression
-        if isinstance(roll_expr, str):
+        # Resolve template in roll expression. Every Jinja delimiter starts
+        # with "{", so a brace-free roll like "3d6" renders unchanged and the
+        # resolver (which copies the whole context) can be skipped.
+        if isinstance(roll_expr, str) and "{" in roll_expr:
             roll_expr = context.resolve_template(roll_expr)
 
         logger.debug(f"Rolling dice: {roll_expr}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from grimoire_context import GrimoireContext
@@ -11,6 +12,7 @@ from ...models.grimoire_definitions import FlowStep
 from ..decorators import handle_execution_error
 from ..dice_service import DiceService
 from ..exceptions import FlowExecutionError
+from . import set_step_values
 
 logger = get_logger(__name__)
 
@@ -45,7 +47,7 @@ class DiceSequenceStepExecutor:
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
     ) -> GrimoireContext:
         """Execute a dice_sequence step.
@@ -80,29 +82,35 @@ class DiceSequenceStepExecutor:
 
         logger.debug(f"Rolling dice sequence for {len(items)} items")
 
+        # A brace-free expression has no template to resolve; any template
+        # is resolved per item, since it may read loop state or be random
+        roll_text = str(roll_expr)
+        literal_roll = "{" not in roll_text
+
         # Iterate over items and roll dice for each
         for item in items:
-            # Set current item in step namespace
-            context = context.set_variable(f"{step_namespace}.item", item)
-
-            # Create top-level alias for item
-            context = context.set_variable("item", item)
+            # Set current item in step namespace and its top-level alias
+            context = set_step_values(
+                context, step_namespace, {"item": item}, {"item": item}
+            )
 
             # Resolve template in roll expression (may reference item)
-            resolved_roll = context.resolve_template(str(roll_expr))
+            roll = roll_text if literal_roll else context.resolve_template(roll_text)
 
             # Execute dice roll
-            dice_result = self.dice_service.roll_dice(resolved_roll)
+            dice_result = self.dice_service.roll_dice(roll)
 
-            # Store result in step namespace
+            # Store result in step namespace and its top-level alias
             result_dict = {
                 "total": dice_result.total,
                 "detail": dice_result.description,
             }
-            context = context.set_variable(f"{step_namespace}.result", result_dict)
-
-            # Create top-level alias for result
-            context = context.set_variable("result", result_dict)
+            context = set_step_values(
+                context,
+                step_namespace,
+                {"result": result_dict},
+                {"result": result_dict},
+            )
 
             # Execute sequence actions for this item
             for action in sequence_actions:
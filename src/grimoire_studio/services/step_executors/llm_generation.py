@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from grimoire_context import GrimoireContext
@@ -10,7 +11,7 @@ from grimoire_logging import get_logger
 from ...models.grimoire_definitions import CompleteSystem, FlowStep
 from ..decorators import handle_execution_error
 from ..exceptions import FlowExecutionError
-from ..llm_service import LLMConfig, LLMService
+from ..llm_service import LLMConfig, LLMService, format_prompt
 
 logger = get_logger(__name__)
 
@@ -36,6 +37,9 @@ class LLMGenerationStepExecutor:
         self.system = system
         self.llm_service = llm_service
         self.template_dict_resolver = template_dict_resolver
+        # Settings and config most recently applied to the LLM service
+        self._applied_settings: tuple[Any, ...] | None = None
+        self._applied_config: LLMConfig | None = None
 
     @handle_execution_error("LLM generation")
     def execute(
@@ -43,7 +47,7 @@ class LLMGenerationStepExecutor:
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
     ) -> GrimoireContext:
         """Execute an llm_generation step.
@@ -82,23 +86,15 @@ class LLMGenerationStepExecutor:
         # Resolve templates in prompt data
         resolved_data = self.template_dict_resolver(prompt_data, context)
 
-        # Substitute prompt template
-        prompt_text = prompt_def.prompt_template.format(**resolved_data)
+        # Substitute prompt template (parsed once per distinct template)
+        prompt_text = format_prompt(prompt_def.prompt_template, resolved_data)
 
         # Get LLM settings (use step config or prompt default)
         llm_settings = step.step_config.get("llm_settings", prompt_def.llm)
 
         # Update LLM service config if needed
         if llm_settings:
-            config = LLMConfig(
-                provider=llm_settings.get("provider", "mock"),
-                model=llm_settings.get("model", "mock-model"),
-                temperature=llm_settings.get("temperature", 0.7),
-                max_tokens=llm_settings.get("max_tokens", 500),
-                api_key=llm_settings.get("api_key"),
-                base_url=llm_settings.get("base_url"),
-            )
-            self.llm_service.set_config(config)
+            self._apply_llm_settings(llm_settings)
 
         # Execute LLM prompt
         llm_result = self.llm_service.execute_prompt(prompt_text)
@@ -108,3 +104,40 @@ class LLMGenerationStepExecutor:
 
         logger.info(f"LLM generation completed: {len(llm_result.response)} chars")
         return context
+
+    def _apply_llm_settings(self, llm_settings: dict[str, Any]) -> None:
+        """Configure the LLM service from step or prompt settings.
+
+        The config is only rebuilt when the settings differ from the last
+        ones applied, or when something else has replaced the service's
+        config since.
+
+        Args:
+            llm_settings: LLM settings dictionary
+        """
+        settings = (
+            llm_settings.get("provider", "mock"),
+            llm_settings.get("model", "mock-model"),
+            llm_settings.get("temperature", 0.7),
+            llm_settings.get("max_tokens", 500),
+            llm_settings.get("api_key"),
+            llm_settings.get("base_url"),
+        )
+        if (
+            settings == self._applied_settings
+            and self.llm_service.get_config() is self._applied_config
+        ):
+            return
+
+        provider, model, temperature, max_tokens, api_key, base_url = settings
+        config = LLMConfig(
+            provider=provider,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_key=api_key,
+            base_url=base_url,
+        )
+        self.llm_service.set_config(config)
+        self._applied_settings = settings
+        self._applied_config = config
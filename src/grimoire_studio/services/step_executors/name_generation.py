@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from grimoire_context import GrimoireContext
@@ -17,13 +18,19 @@ logger = get_logger(__name__)
 class NameGenerationStepExecutor:
     """Executor for name_generation steps."""
 
+    def __init__(self) -> None:
+        """Initialize the name generation step executor."""
+        # Name services by (corpus, segmenter); building one loads and
+        # segments the whole corpus
+        self._name_services: dict[tuple[str, str], NameService] = {}
+
     @handle_execution_error("Name generation")
     def execute(
         self,
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
     ) -> GrimoireContext:
         """Execute a name_generation step.
@@ -52,12 +59,14 @@ class NameGenerationStepExecutor:
         segmenter = settings.get("segmenter", "fantasy")
         algorithm = settings.get("algorithm", "bayesian")
 
-        # Create name service with the specified corpus
-        # Note: We create a new instance per step to allow different corpora
-        name_service = NameService(
-            name_list=corpus,
-            segmenter=segmenter,
-        )
+        # Reuse the name service for this corpus, creating it on first use
+        name_service = self._name_services.get((corpus, segmenter))
+        if name_service is None:
+            name_service = NameService(
+                name_list=corpus,
+                segmenter=segmenter,
+            )
+            self._name_services[(corpus, segmenter)] = name_service
 
         # Generate name
         generated_name = name_service.generate_name(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from grimoire_context import GrimoireContext
@@ -10,9 +12,13 @@ from grimoire_logging import get_logger
 from ...models.grimoire_definitions import FlowStep
 from ..decorators import handle_execution_error
 from ..exceptions import FlowExecutionError
+from . import ContextView, set_step_values
 
 logger = get_logger(__name__)
 
+_DATA_PATH = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*")
+_MISSING = object()
+
 
 class PlayerChoiceStepExecutor:
     """Executor for player_choice steps."""
@@ -44,7 +50,7 @@ class PlayerChoiceStepExecutor:
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
     ) -> GrimoireContext:
         """Execute a player_choice step.
@@ -73,14 +79,13 @@ class PlayerChoiceStepExecutor:
         choice_source = step.step_config.get("choice_source")
         if choice_source:
             choices = self._generate_dynamic_choices(choice_source, context)
+            # Store generated choices in step config so UI can access them
+            step.step_config["choices"] = choices
         else:
             choices = step.step_config.get("choices", [])
 
-        # Store generated choices in step config so UI can access them
-        step.step_config["choices"] = choices
-
-        # Get current context data for callback
-        callback_context = context.to_dict()
+        # Expose context data to the callback without copying it
+        callback_context = ContextView(context)
 
         # Call user choice callback (choice ID or array of choice IDs)
         user_choice = on_user_input(step, callback_context)
@@ -100,11 +105,14 @@ class PlayerChoiceStepExecutor:
                 raise FlowExecutionError(
                     f"Expected {selection_count} selections, got {len(user_choice)}"
                 )
-            context = context.set_variable(f"{step_namespace}.results", user_choice)
-            # Create top-level alias for results (needed for actions)
-            context = context.set_variable("results", user_choice)
-            # For compatibility, also store first selection as result
-            context = context.set_variable(f"{step_namespace}.result", user_choice[0])
+            # Store 'results' with a top-level alias (needed for actions) and,
+            # for compatibility, the first selection as result
+            context = set_step_values(
+                context,
+                step_namespace,
+                {"results": user_choice, "result": user_choice[0]},
+                {"results": user_choice},
+            )
             selected_choice = None  # No single choice actions
         else:
             # Single selection: store as 'result'
@@ -134,7 +142,7 @@ class PlayerChoiceStepExecutor:
                     selected_choice["next_step"],
                 )
 
-        logger.info(f"Player choice: {user_choice}")
+        logger.info("Player choice: %s", user_choice)
         return context
 
     @handle_execution_error("Failed to generate dynamic choices")
@@ -159,23 +167,30 @@ class PlayerChoiceStepExecutor:
         if not table_from_values:
             raise ValueError("choice_source requires 'table_from_values' field")
 
-        # Resolve the data path
-        data = context.resolve_template(f"{{{{ {table_from_values} }}}}")
+        # Resolve the data path; a plain dotted path is read from the context
+        # directly rather than rendered through a "{{ path }}" template
+        if _DATA_PATH.fullmatch(table_from_values):
+            data = context.get_variable(table_from_values, _MISSING)
+            if data is _MISSING:
+                raise ValueError(f"No data found at '{table_from_values}'")
+        else:
+            data = context.resolve_template(f"{{{{ {table_from_values} }}}}")
 
         if not isinstance(data, dict):
             raise ValueError(f"Data at '{table_from_values}' is not a dictionary")
 
+        # Copy the context variables once and rebind key/value per entry,
+        # rather than cloning the context several times for every entry
+        variables = context.to_dict()
+        resolve = self.template_resolver.resolve_template
+
         choices = []
         for key, value in data.items():
-            # Set temporary variables for template rendering
-            temp_context = context.set_variable("key", key)
-            temp_context = temp_context.set_variable("value", value)
-
-            # Ensure template resolver is set
-            temp_context = temp_context.set_template_resolver(self.template_resolver)
+            variables["key"] = key
+            variables["value"] = value
 
             # Resolve the display format template
-            label = temp_context.resolve_template(display_format)
+            label = resolve(display_format, variables)
 
             choices.append(
                 {
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from grimoire_context import GrimoireContext
@@ -10,6 +11,7 @@ from grimoire_logging import get_logger
 from ...models.grimoire_definitions import FlowStep
 from ..decorators import handle_execution_error
 from ..exceptions import FlowExecutionError
+from . import ContextView
 
 logger = get_logger(__name__)
 
@@ -23,7 +25,7 @@ class PlayerInputStepExecutor:
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
     ) -> GrimoireContext:
         """Execute a player_input step.
@@ -48,8 +50,8 @@ class PlayerInputStepExecutor:
                 f"player_input step '{step.id}' requires on_user_input callback"
             )
 
-        # Get current context data for callback
-        callback_context = context.to_dict()
+        # Expose context data to the callback without copying it
+        callback_context = ContextView(context)
 
         # Call user input callback
         user_input = on_user_input(step, callback_context)
@@ -57,5 +59,5 @@ class PlayerInputStepExecutor:
         # Store result in step namespace
         context = context.set_variable(f"{step_namespace}.result", user_input)
 
-        logger.info(f"Player input received: {user_input}")
+        logger.info("Player input received: %s", user_input)
         return context
@@ -2,18 +2,109 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable
+import bisect
+from collections.abc import Mapping
+from typing import Any, Callable, NamedTuple
 
 from grimoire_context import GrimoireContext
 from grimoire_logging import get_logger
 
-from ...models.grimoire_definitions import CompleteSystem, FlowStep
+from ...models.grimoire_definitions import CompleteSystem, FlowStep, TableDefinition
 from ..decorators import handle_execution_error
 from ..dice_service import DiceService
 from ..exceptions import FlowExecutionError
+from . import set_step_values
 
 logger = get_logger(__name__)
 
+# Parsed table entry: (lowest roll, highest roll, entry value)
+_EntryRange = tuple[int, int, Any]
+
+
+def _parse_entry_ranges(entries: list[dict[str, Any]]) -> list[_EntryRange]:
+    """Parse the roll ranges of table entries.
+
+    Ranges are either "low-high" or a single roll total. Single values that
+    are not the canonical string of an integer can never match a roll and
+    are skipped.
+
+    Args:
+        entries: Table entries with "range" and "value" keys
+
+    Returns:
+        Parsed ranges in entry order
+
+    Raises:
+        ValueError: If a "low-high" range is not two integers
+    """
+    ranges = []
+    for entry in entries:
+        entry_range = str(entry.get("range", ""))
+        low_text, dash, high_text = entry_range.partition("-")
+        if dash:
+            low, high = int(low_text), int(high_text)
+        else:
+            try:
+                low = high = int(entry_range)
+            except ValueError:
+                continue
+            if str(low) != entry_range:
+                continue
+        if low <= high:
+            ranges.append((low, high, entry.get("value")))
+    return ranges
+
+
+class _TableRanges(NamedTuple):
+    """Parsed entry ranges of a table, cached per table id.
+
+    Attributes:
+        entries: Entries list the ranges were parsed from
+        ranges: Parsed ranges, sorted by low when lows is set
+        lows: Sorted range starts for bisect lookup, or None if ranges
+            overlap and must be scanned in entry order
+    """
+
+    entries: list[dict[str, Any]]
+    ranges: list[_EntryRange]
+    lows: list[int] | None
+
+    @classmethod
+    def parse(cls, entries: list[dict[str, Any]]) -> _TableRanges:
+        """Parse entries, indexing them for bisect when ranges are disjoint.
+
+        Args:
+            entries: Table entries with "range" and "value" keys
+
+        Returns:
+            Parsed table ranges
+        """
+        ranges = _parse_entry_ranges(entries)
+        ordered = sorted(ranges, key=lambda entry_range: entry_range[0])
+        if all(prev[1] < cur[0] for prev, cur in zip(ordered, ordered[1:])):
+            return cls(entries, ordered, [low for low, _, _ in ordered])
+        return cls(entries, ranges, None)
+
+    def find(self, roll_total: int) -> Any:
+        """Find the value of the entry whose range contains a roll.
+
+        Args:
+            roll_total: Total of the table roll
+
+        Returns:
+            Value of the first matching entry, or None if no range matches
+        """
+        if self.lows is not None:
+            index = bisect.bisect_right(self.lows, roll_total) - 1
+            if index >= 0 and roll_total <= self.ranges[index][1]:
+                return self.ranges[index][2]
+            return None
+
+        for low, high, entry_val in self.ranges:
+            if low <= roll_total <= high:
+                return entry_val
+        return None
+
 
 class TableRollStepExecutor:
     """Executor for table_roll steps."""
@@ -41,6 +132,8 @@ class TableRollStepExecutor:
         self.system = system
         self.dice_service = dice_service
         self.action_executor = action_executor
+        # Parsed entry ranges per table
+        self._table_ranges: dict[str, _TableRanges] = {}
 
     @handle_execution_error("Table roll")
     def execute(
@@ -48,7 +141,7 @@ class TableRollStepExecutor:
         step: FlowStep,
         context: GrimoireContext,
         step_namespace: str,
-        on_user_input: Callable[[FlowStep, dict[str, Any]], Any] | None = None,
+        on_user_input: Callable[[FlowStep, Mapping[str, Any]], Any] | None = None,
         on_action_execute: Callable[[str, dict[str, Any]], None] | None = None,
     ) -> GrimoireContext:
         """Execute a table_roll step.
@@ -75,64 +168,31 @@ class TableRollStepExecutor:
 
         logger.debug(f"Rolling on {len(tables_config)} tables")
 
+        # Without table actions nothing reads a result before the next table
+        # overwrites it, so roll every table up front and store only the last
+        if not any(table_config.get("actions") for table_config in tables_config):
+            results = [
+                self._roll_table(step, table_config) for table_config in tables_config
+            ]
+            return set_step_values(
+                context,
+                step_namespace,
+                {"result": results[-1]},
+                {"result": results[-1]},
+            )
+
         # Process each table
         for table_config in tables_config:
-            table_id = table_config.get("table")
-            if not table_id:
-                raise FlowExecutionError(
-                    f"table_roll step '{step.id}' has table config "
-                    "without 'table' field"
-                )
-
-            # Look up table in system
-            if table_id not in self.system.tables:
-                raise FlowExecutionError(f"Table '{table_id}' not found in system")
-
-            table_def = self.system.tables[table_id]
-
-            # Roll dice for the table
-            if not table_def.roll:
-                raise FlowExecutionError(
-                    f"Table '{table_id}' has no roll expression defined"
-                )
-
-            dice_result = self.dice_service.roll_dice(table_def.roll)
-            roll_total = dice_result.total
-
-            # Find matching entry
-            entry_value = None
-            for entry in table_def.entries:
-                entry_range = entry.get("range", "")
-                entry_val = entry.get("value")
-
-                # Parse range (e.g., "1-5", "6", "7-10")
-                if "-" in str(entry_range):
-                    low, high = map(int, str(entry_range).split("-"))
-                    if low <= roll_total <= high:
-                        entry_value = entry_val
-                        break
-                elif str(roll_total) == str(entry_range):
-                    entry_value = entry_val
-                    break
-
-            if entry_value is None:
-                logger.warning(
-                    f"No matching entry for roll {roll_total} in table '{table_id}'"
-                )
-                entry_value = f"<no match for {roll_total}>"
-
-            # Store result in step namespace
-            result_dict = {
-                "entry": entry_value,
-                "roll_result": {
-                    "total": dice_result.total,
-                    "detail": dice_result.description,
-                },
-            }
-            context = context.set_variable(f"{step_namespace}.result", result_dict)
-
-            # Create top-level alias for table actions to use
-            context = context.set_variable("result", result_dict)
+            result_dict = self._roll_table(step, table_config)
+
+            # Store result in step namespace with a top-level alias for table
+            # actions to use
+            context = set_step_values(
+                context,
+                step_namespace,
+                {"result": result_dict},
+                {"result": result_dict},
+            )
 
             # Execute table-specific actions if any
             table_actions = table_config.get("actions", [])
@@ -140,3 +200,76 @@ class TableRollStepExecutor:
                 context = self.action_executor(action, context, on_action_execute)
 
         return context
+
+    def _roll_table(
+        self, step: FlowStep, table_config: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Roll on one configured table and look up the matching entry.
+
+        Args:
+            step: Step being executed
+            table_config: Table configuration from the step
+
+        Returns:
+            Result with the entry value and the roll total and detail
+
+        Raises:
+            FlowExecutionError: If the table is missing or has no roll
+        """
+        table_id = table_config.get("table")
+        if not table_id:
+            raise FlowExecutionError(
+                f"table_roll step '{step.id}' has table config without 'table' field"
+            )
+
+        # Look up table in system
+        if table_id not in self.system.tables:
+            raise FlowExecutionError(f"Table '{table_id}' not found in system")
+
+        table_def = self.system.tables[table_id]
+
+        # Roll dice for the table
+        if not table_def.roll:
+            raise FlowExecutionError(
+                f"Table '{table_id}' has no roll expression defined"
+            )
+
+        dice_result = self.dice_service.roll_dice(table_def.roll)
+        roll_total = dice_result.total
+
+        # Find matching entry
+        entry_value = self._get_table_ranges(table_id, table_def).find(roll_total)
+
+        if entry_value is None:
+            logger.warning(
+                f"No matching entry for roll {roll_total} in table '{table_id}'"
+            )
+            entry_value = f"<no match for {roll_total}>"
+
+        return {
+            "entry": entry_value,
+            "roll_result": {
+                "total": dice_result.total,
+                "detail": dice_result.description,
+            },
+        }
+
+    def _get_table_ranges(
+        self, table_id: str, table_def: TableDefinition
+    ) -> _TableRanges:
+        """Get the parsed entry ranges of a table, parsing them on first use.
+
+        Args:
+            table_id: ID of the table
+            table_def: Table definition being rolled on
+
+        Returns:
+            Parsed table ranges
+        """
+        cached = self._table_ranges.get(table_id)
+        if cached is not None and cached.entries is table_def.entries:
+            return cached
+
+        table_ranges = _TableRanges.parse(table_def.entries)
+        self._table_ranges[table_id] = table_ranges
+        return table_ranges
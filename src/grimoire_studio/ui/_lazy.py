@@ -0,0 +1,49 @@
+"""
+Lazy exports for the GRIMOIRE Design Studio UI packages.
+
+The UI packages export their classes through a module ``__getattr__``
+(PEP 562), so importing one widget module does not load its siblings.
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Build a package ``__getattr__`` that imports exports on first access.
+
+    Each name is imported from its submodule on first lookup and then stored
+    on the package, so later lookups no longer reach ``__getattr__``.
+
+    Args:
+        package: Name of the package, i.e. its ``__name__``
+        exports: Exported names mapped to the relative submodules defining them
+
+    Returns:
+        Function to assign to the package's ``__getattr__``
+    """
+
+    def __getattr__(name: str) -> Any:
+        """Import an exported name on first access.
+
+        Args:
+            name: Attribute being looked up
+
+        Returns:
+            The exported object
+
+        Raises:
+            AttributeError: If the name is not exported by the package
+        """
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
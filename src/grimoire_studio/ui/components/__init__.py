@@ -4,8 +4,24 @@ UI Components for GRIMOIRE Design Studio.
 This package contains reusable UI components used throughout the application.
 """
 
-from .output_console import OutputConsole
-from .project_browser import ProjectBrowser
-from .yaml_highlighter import YamlSyntaxHighlighter
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .output_console import OutputConsole
+    from .project_browser import ProjectBrowser
+    from .yaml_highlighter import YamlSyntaxHighlighter
+
+# Exported names and the submodules defining them, imported on first access
+_EXPORTS = {
+    "OutputConsole": ".output_console",
+    "ProjectBrowser": ".project_browser",
+    "YamlSyntaxHighlighter": ".yaml_highlighter",
+}
 
 __all__ = ["OutputConsole", "ProjectBrowser", "YamlSyntaxHighlighter"]
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
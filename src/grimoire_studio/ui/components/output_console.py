@@ -7,13 +7,18 @@ proper formatting, color coding, and automatic tab switching.
 """
 
 import logging
-from datetime import datetime
+import queue
+import time
+from collections import deque
+from itertools import groupby
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
 from grimoire_logging import get_logger
 from PyQt6.QtCore import QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
+from PyQt6.QtGui import QBrush, QColor, QFont, QTextCharFormat, QTextCursor
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -27,6 +32,26 @@ from PyQt6.QtWidgets import (
 
 logger = get_logger(__name__)
 
+# Second and "HH:MM:SS" text of the most recent console timestamp
+_last_timestamp: tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    """
+    Get the current local time as "HH:MM:SS" for console lines.
+
+    The text is formatted once per second and reused for every line written
+    within that second.
+
+    Returns:
+        Current time formatted as "HH:MM:SS"
+    """
+    global _last_timestamp
+    second = int(time.time())
+    if second != _last_timestamp[0]:
+        _last_timestamp = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+    return _last_timestamp[1]
+
 
 class OutputConsole(QWidget):
     """
@@ -53,8 +78,38 @@ class OutputConsole(QWidget):
     INFO_COLOR = QColor("#17a2b8")  # Bootstrap info blue
     DEBUG_COLOR = QColor("#6c757d")  # Bootstrap secondary gray
 
+    # Color and prefix per message level; unknown levels display as "info"
+    _VALIDATION_LEVELS = {
+        "error": (ERROR_COLOR, "❌ ERROR: "),
+        "warning": (WARNING_COLOR, "⚠️  WARNING: "),
+        "success": (SUCCESS_COLOR, "✅ SUCCESS: "),
+        "info": (INFO_COLOR, "ℹ️  INFO: "),
+    }
+    _EXECUTION_LEVELS = {
+        "error": (ERROR_COLOR, "[ERROR] "),
+        "warning": (WARNING_COLOR, "[WARNING] "),
+        "success": (SUCCESS_COLOR, "[SUCCESS] "),
+        "info": (INFO_COLOR, "[INFO] "),
+    }
+
+    # Color and name per logging level threshold, highest first; lower
+    # levels display as DEBUG
+    _LOG_LEVELS = (
+        (logging.ERROR, ERROR_COLOR, "ERROR"),
+        (logging.WARNING, WARNING_COLOR, "WARNING"),
+        (logging.INFO, INFO_COLOR, "INFO"),
+    )
+
+    # Delay for coalescing log records into one logs tab update
+    LOG_FLUSH_INTERVAL_MS = 40
+
+    # Default number of lines kept per tab; older lines are dropped
+    DEFAULT_MAX_LINES = {"validation": 2000, "execution": 5000, "logs": 10000}
+
     # Signals
     content_added = pyqtSignal(str)  # Emitted when content is added to any tab
+    # Carries log records (message, level, logger name) to the GUI thread
+    _log_received = pyqtSignal(str, int, str)
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """
@@ -76,8 +131,30 @@ class OutputConsole(QWidget):
         # Users can change this later if needed via set_log_level_filter()
         self._log_level_filter = logging.INFO
 
-        # Project root path for relative path display
+        # Project root path for relative path display, and the display paths
+        # computed against it (validation often repeats the same files)
         self._project_root: Optional[Path] = None
+        self._relative_paths: dict[str, str] = {}
+
+        # Character formats per color (keyed by RGBA), built once and reused
+        # for every append
+        self._char_formats: dict[int, QTextCharFormat] = {}
+        for color in (
+            self.ERROR_COLOR,
+            self.WARNING_COLOR,
+            self.SUCCESS_COLOR,
+            self.INFO_COLOR,
+            self.DEBUG_COLOR,
+        ):
+            self._get_char_format(color)
+
+        # Log lines received from the logging system, written to the logs tab
+        # together on the next flush tick
+        self._pending_logs: list[tuple[str, QColor]] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_pending_logs)
 
         # Setup UI
         self._setup_ui()
@@ -96,6 +173,21 @@ class OutputConsole(QWidget):
         self._tab_widget = QTabWidget()
         layout.addWidget(self._tab_widget)
 
+        # One stylesheet for the text areas of all tabs
+        self.setObjectName("OutputConsole")
+        self.setStyleSheet(
+            """
+            #OutputConsole QTextEdit {
+                background-color: #f8f9fa;
+                border: 1px solid #dee2e6;
+                padding: 8px;
+            }
+            """
+        )
+
+        # Resolve the monospace font once for all tabs
+        self._console_font = self._get_console_font()
+
         # Create tabs
         self._create_validation_tab()
         self._create_execution_tab()
@@ -123,16 +215,9 @@ class OutputConsole(QWidget):
         # Text area
         self._validation_text = QTextEdit()
         self._validation_text.setReadOnly(True)
-        self._validation_text.setFont(self._get_console_font())
-        self._validation_text.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                padding: 8px;
-            }
-            """
-        )
+        self._validation_text.setFont(self._console_font)
+        self._validation_text.setUndoRedoEnabled(False)
+        self._limit_lines(self._validation_text, self.DEFAULT_MAX_LINES["validation"])
 
         layout.addWidget(self._validation_text)
 
@@ -157,16 +242,9 @@ class OutputConsole(QWidget):
         # Text area
         self._execution_text = QTextEdit()
         self._execution_text.setReadOnly(True)
-        self._execution_text.setFont(self._get_console_font())
-        self._execution_text.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                padding: 8px;
-            }
-            """
-        )
+        self._execution_text.setFont(self._console_font)
+        self._execution_text.setUndoRedoEnabled(False)
+        self._limit_lines(self._execution_text, self.DEFAULT_MAX_LINES["execution"])
 
         layout.addWidget(self._execution_text)
 
@@ -228,21 +306,27 @@ class OutputConsole(QWidget):
         # Text area
         self._logs_text = QTextEdit()
         self._logs_text.setReadOnly(True)
-        self._logs_text.setFont(self._get_console_font())
-        self._logs_text.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                padding: 8px;
-            }
-            """
-        )
+        self._logs_text.setFont(self._console_font)
+        self._logs_text.setUndoRedoEnabled(False)
+        self._limit_lines(self._logs_text, self.DEFAULT_MAX_LINES["logs"])
 
         layout.addWidget(self._logs_text)
 
         self._tab_widget.addTab(tab_widget, "Logs")
 
+    @staticmethod
+    def _limit_lines(text_edit: QTextEdit, max_lines: int) -> None:
+        """
+        Limit the number of lines (text blocks) a text edit keeps.
+
+        Args:
+            text_edit: The QTextEdit to limit
+            max_lines: Maximum number of lines, or 0 for no limit
+        """
+        document = text_edit.document()
+        if document is not None:
+            document.setMaximumBlockCount(max_lines)
+
     def _get_console_font(self) -> QFont:
         """Get a monospace font for console display."""
         font = QFont("Consolas")
@@ -257,14 +341,29 @@ class OutputConsole(QWidget):
 
     def _setup_logging_handler(self) -> None:
         """Set up logging handler to capture ALL application logs from the same logger that feeds the terminal."""
-        # Create simple log handler - no batching, immediate display
+        # Records reach the log handler through a queue so logging callers
+        # only enqueue; the handler runs on the listener thread and signals
+        # the GUI thread, which alone touches the text widgets
+        self._log_received.connect(self._queue_log_message)
         self._log_handler = LogHandler(self, use_batching=False)
         self._log_handler.setLevel(self._log_level_filter)
 
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(log_queue)
+        self._queue_handler.setLevel(self._log_level_filter)
+        self._log_listener = QueueListener(
+            log_queue, self._log_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+
         # The main app sends all logs through the root logger, so we attach there
         # to capture the same messages that appear in the terminal
         root_logger = logging.getLogger()
-        root_logger.addHandler(self._log_handler)
+        root_logger.addHandler(self._queue_handler)
+
+        # Consoles deleted along with their parent never see a closeEvent
+        listener, queue_handler = self._log_listener, self._queue_handler
+        self.destroyed.connect(lambda: _detach_log_listener(listener, queue_handler))
 
         self._logger.debug("OutputConsole handler attached to root logger")
 
@@ -279,21 +378,54 @@ class OutputConsole(QWidget):
             text: Text to append
             color: Color for the text
         """
+        self._append_colored_runs(text_edit, [(text, color)])
+
+    def _append_colored_runs(
+        self, text_edit: QTextEdit, runs: list[tuple[str, QColor]]
+    ) -> None:
+        """
+        Append several pieces of colored text to a text edit widget at once.
+
+        Consecutive pieces of the same color are inserted together, and the
+        view scrolls once at the end.
+
+        Args:
+            text_edit: The QTextEdit to append to
+            runs: (text, color) pairs to append in order
+        """
         # Move cursor to end
         cursor = text_edit.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
 
-        # Create format with color
-        format = QTextCharFormat()
-        format.setForeground(color)
-
-        # Insert text with format
-        cursor.insertText(text, format)
+        for color, same_color_runs in groupby(runs, key=itemgetter(1)):
+            # Insert text with the format for its color
+            cursor.insertText(
+                "".join(text for text, _ in same_color_runs),
+                self._get_char_format(color),
+            )
 
         # Ensure cursor moves to end and text is visible
         text_edit.setTextCursor(cursor)
         text_edit.ensureCursorVisible()
 
+    def _get_char_format(self, color: QColor) -> QTextCharFormat:
+        """
+        Get the character format for text of a color, creating it on first use.
+
+        Args:
+            color: Text color
+
+        Returns:
+            Character format with the color as foreground
+        """
+        key = color.rgba()
+        char_format = self._char_formats.get(key)
+        if char_format is None:
+            char_format = QTextCharFormat()
+            char_format.setForeground(QBrush(color))
+            self._char_formats[key] = char_format
+        return char_format
+
     def _switch_to_tab(self, tab_index: int) -> None:
         """
         Switch to a specific tab.
@@ -332,6 +464,7 @@ class OutputConsole(QWidget):
         Args:
             project_path: Path to the project root directory, or None to clear
         """
+        self._relative_paths.clear()
         if project_path:
             self._project_root = Path(project_path).resolve()
             self._logger.debug(f"Project root set to: {self._project_root}")
@@ -352,15 +485,22 @@ class OutputConsole(QWidget):
         if not self._project_root or not file_path:
             return file_path
 
+        display_path = self._relative_paths.get(file_path)
+        if display_path is not None:
+            return display_path
+
         try:
             path = Path(file_path).resolve()
             # Try to make it relative to project root
             relative_path = path.relative_to(self._project_root)
             # Use forward slashes for cross-platform compatibility
-            return relative_path.as_posix()
+            display_path = relative_path.as_posix()
         except (ValueError, OSError):
             # If path is not within project root, return original
-            return file_path
+            display_path = file_path
+
+        self._relative_paths[file_path] = display_path
+        return display_path
 
     def display_validation_results(
         self, results: list[dict[str, Any]], auto_switch: bool = True
@@ -379,33 +519,34 @@ class OutputConsole(QWidget):
         if auto_switch:
             self._switch_to_tab(self._validation_tab_index)
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self._append_colored_text(
-            self._validation_text,
-            f"[{timestamp}] Validation Results:\n",
-            self.INFO_COLOR,
-        )
+        # Collect the whole block and append it in one update
+        timestamp = _timestamp()
+        runs = [(f"[{timestamp}] Validation Results:\n", self.INFO_COLOR)]
 
         # Check if there are any validation failures (errors or warnings)
-        failures = [
-            r for r in results if r.get("level", "").lower() in ["error", "warning"]
-        ]
+        has_failures = any(
+            r.get("level", "").lower() in ("error", "warning") for r in results
+        )
 
         if not results:
             # No validation results at all - show success message
-            self._append_colored_text(
-                self._validation_text,
-                "✅ No validation issues found. All files are valid!\n",
-                self.SUCCESS_COLOR,
+            runs.append(
+                (
+                    "✅ No validation issues found. All files are valid!\n",
+                    self.SUCCESS_COLOR,
+                )
             )
-        elif not failures:
+        elif not has_failures:
             # Results exist but no failures - show success message
-            self._append_colored_text(
-                self._validation_text,
-                "✅ Validation completed successfully. No errors or warnings found!\n",
-                self.SUCCESS_COLOR,
+            runs.append(
+                (
+                    "✅ Validation completed successfully. "
+                    "No errors or warnings found!\n",
+                    self.SUCCESS_COLOR,
+                )
             )
 
+        validation_levels = self._VALIDATION_LEVELS
         for result in results:
             level = result.get("level", "info").lower()
             message = result.get("message", "Unknown validation result")
@@ -413,18 +554,7 @@ class OutputConsole(QWidget):
             line_num = result.get("line")
 
             # Determine color based on level
-            if level == "error":
-                color = self.ERROR_COLOR
-                prefix = "❌ ERROR: "
-            elif level == "warning":
-                color = self.WARNING_COLOR
-                prefix = "⚠️  WARNING: "
-            elif level == "success":
-                color = self.SUCCESS_COLOR
-                prefix = "✅ SUCCESS: "
-            else:
-                color = self.INFO_COLOR
-                prefix = "ℹ️  INFO: "
+            color, prefix = validation_levels.get(level, validation_levels["info"])
 
             # Format message with file/line if available
             full_message = f"{prefix}{message}"
@@ -436,12 +566,11 @@ class OutputConsole(QWidget):
                 else:
                     full_message += f" (in {file_display})"
 
-            self._append_colored_text(self._validation_text, full_message + "\n", color)
+            runs.append((full_message + "\n", color))
 
         # Add separator
-        self._append_colored_text(
-            self._validation_text, "-" * 50 + "\n\n", self.DEBUG_COLOR
-        )
+        runs.append(("-" * 50 + "\n\n", self.DEBUG_COLOR))
+        self._append_colored_runs(self._validation_text, runs)
 
         # Emit signal
         self.content_added.emit("validation")
@@ -460,22 +589,13 @@ class OutputConsole(QWidget):
         if auto_switch:
             self._switch_to_tab(self._execution_tab_index)
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = _timestamp()
         level = level.lower()
 
         # Determine color and prefix
-        if level == "error":
-            color = self.ERROR_COLOR
-            prefix = "[ERROR] "
-        elif level == "warning":
-            color = self.WARNING_COLOR
-            prefix = "[WARNING] "
-        elif level == "success":
-            color = self.SUCCESS_COLOR
-            prefix = "[SUCCESS] "
-        else:
-            color = self.INFO_COLOR
-            prefix = "[INFO] "
+        color, prefix = self._EXECUTION_LEVELS.get(
+            level, self._EXECUTION_LEVELS["info"]
+        )
 
         full_message = f"[{timestamp}] {prefix}{message}\n"
         self._append_colored_text(self._execution_text, full_message, color)
@@ -498,21 +618,61 @@ class OutputConsole(QWidget):
         if level < self._log_level_filter:
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        full_message, color = self._format_log_message(message, level, logger_name)
+        self._append_colored_text(self._logs_text, full_message, color)
+
+        # Emit signal
+        self.content_added.emit("logs")
+
+    def _queue_log_message(self, message: str, level: int, logger_name: str) -> None:
+        """
+        Queue a log message from the logging system for the next flush tick.
+
+        Args:
+            message: The log message
+            level: Logging level (from logging module constants)
+            logger_name: Name of the logger that generated the message
+        """
+        if level < self._log_level_filter:
+            return
+
+        self._pending_logs.append(self._format_log_message(message, level, logger_name))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_pending_logs(self) -> None:
+        """Write all queued log messages to the logs tab in one update."""
+        if not self._pending_logs:
+            return
+
+        pending, self._pending_logs = self._pending_logs, []
+        self._append_colored_runs(self._logs_text, pending)
+
+        # Emit signal
+        self.content_added.emit("logs")
+
+    def _format_log_message(
+        self, message: str, level: int, logger_name: str
+    ) -> tuple[str, QColor]:
+        """
+        Format a log message line for the logs tab.
+
+        Args:
+            message: The log message
+            level: Logging level (from logging module constants)
+            logger_name: Name of the logger that generated the message
+
+        Returns:
+            Tuple of (formatted line, color)
+        """
+        timestamp = _timestamp()
 
         # Determine color and level name
-        if level >= logging.ERROR:
-            color = self.ERROR_COLOR
-            level_name = "ERROR"
-        elif level >= logging.WARNING:
-            color = self.WARNING_COLOR
-            level_name = "WARNING"
-        elif level >= logging.INFO:
-            color = self.INFO_COLOR
-            level_name = "INFO"
-        else:
-            color = self.DEBUG_COLOR
-            level_name = "DEBUG"
+        color, level_name = self.DEBUG_COLOR, "DEBUG"
+        for threshold, threshold_color, threshold_name in self._LOG_LEVELS:
+            if level >= threshold:
+                color, level_name = threshold_color, threshold_name
+                break
 
         # Format message with timestamp and logger
         if logger_name:
@@ -520,10 +680,7 @@ class OutputConsole(QWidget):
         else:
             full_message = f"[{timestamp}] {level_name}: {message}\n"
 
-        self._append_colored_text(self._logs_text, full_message, color)
-
-        # Emit signal
-        self.content_added.emit("logs")
+        return full_message, color
 
     # Tab clearing methods
 
@@ -539,6 +696,7 @@ class OutputConsole(QWidget):
 
     def clear_logs(self) -> None:
         """Clear the logs tab content."""
+        self._pending_logs.clear()
         self._logs_text.clear()
         self._logger.debug("Logs tab cleared")
 
@@ -609,8 +767,33 @@ class OutputConsole(QWidget):
         """
         self._log_level_filter = level
         self._log_handler.setLevel(level)
+        self._queue_handler.setLevel(level)
         self._logger.debug(f"Log level filter set to {logging.getLevelName(level)}")
 
+    def set_max_lines(self, tab: str, max_lines: int) -> None:
+        """
+        Set how many lines a tab keeps before dropping the oldest.
+
+        Args:
+            tab: Tab name: "validation", "execution", or "logs"
+            max_lines: Maximum number of lines, or 0 for no limit
+
+        Raises:
+            ValueError: If the tab name is unknown or max_lines is negative
+        """
+        text_edits = {
+            "validation": self._validation_text,
+            "execution": self._execution_text,
+            "logs": self._logs_text,
+        }
+        if tab not in text_edits:
+            raise ValueError(f"Unknown console tab: {tab}")
+        if max_lines < 0:
+            raise ValueError(f"max_lines must not be negative, got {max_lines}")
+
+        self._limit_lines(text_edits[tab], max_lines)
+        self._logger.debug(f"{tab} tab limited to {max_lines} lines")
+
     def get_current_tab(self) -> str:
         """
         Get the name of the currently active tab.
@@ -639,10 +822,9 @@ class OutputConsole(QWidget):
     def closeEvent(self, event) -> None:  # type: ignore
         """Handle close event to clean up logging handlers."""
         try:
-            # Remove our handler from root logger
-            if hasattr(self, "_log_handler"):
-                root_logger = logging.getLogger()
-                root_logger.removeHandler(self._log_handler)
+            # Remove our handler from root logger and stop the listener
+            if hasattr(self, "_log_listener"):
+                _detach_log_listener(self._log_listener, self._queue_handler)
 
             self._logger.debug("OutputConsole logging handlers cleaned up")
         except Exception as e:
@@ -652,14 +834,37 @@ class OutputConsole(QWidget):
         super().closeEvent(event)
 
 
+def _detach_log_listener(listener: QueueListener, queue_handler: QueueHandler) -> None:
+    """
+    Remove a console's queue handler from the root logger and stop its listener.
+
+    Safe to call more than once; only the first call has an effect.
+
+    Args:
+        listener: Listener feeding the console's log handler
+        queue_handler: Handler enqueueing records for the listener
+    """
+    root_logger = logging.getLogger()
+    if queue_handler in root_logger.handlers:
+        root_logger.removeHandler(queue_handler)
+        listener.stop()
+
+
 class LogHandler(logging.Handler):
     """
     Custom logging handler that sends log messages to the OutputConsole.
 
     This handler captures log messages from the application and forwards them
-    to the OutputConsole's logs tab for real-time monitoring.
+    to the OutputConsole's logs tab for real-time monitoring. Without batching,
+    messages are forwarded through a signal, so the handler may run on any
+    thread (such as a QueueListener's); batching uses a QTimer and must run
+    on the GUI thread.
     """
 
+    # Most messages held between batch flushes; the oldest are dropped first
+    # and reported by count on the next flush
+    MAX_QUEUED_MESSAGES = 10000
+
     def __init__(
         self, output_console: OutputConsole, prefix: str = "", use_batching: bool = True
     ) -> None:
@@ -677,7 +882,10 @@ class LogHandler(logging.Handler):
         self._use_batching = use_batching
 
         # Initialize attributes based on batching mode
-        self._message_queue: Optional[list[tuple]] = []
+        self._message_queue: Optional[deque[tuple[str, int, str]]] = deque(
+            maxlen=self.MAX_QUEUED_MESSAGES
+        )
+        self._dropped_messages = 0
         self._timer: Optional[QTimer] = None
 
         if use_batching:
@@ -703,14 +911,16 @@ class LogHandler(logging.Handler):
 
             if self._use_batching and self._message_queue is not None:
                 # Add to queue for batched processing
+                if len(self._message_queue) == self._message_queue.maxlen:
+                    self._dropped_messages += 1
                 self._message_queue.append((message, record.levelno, record.name))
 
                 # Start timer if not already running
                 if self._timer is not None and not self._timer.isActive():
                     self._timer.start()
             else:
-                # Display immediately
-                self._output_console.display_log_message(
+                # Display as soon as the GUI thread handles the signal
+                self._output_console._log_received.emit(
                     message, record.levelno, record.name
                 )
 
@@ -731,11 +941,18 @@ class LogHandler(logging.Handler):
                 self._timer.stop()
             return
 
-        # Process all queued messages
-        messages_to_process = self._message_queue[:]
-        self._message_queue.clear()
+        # Report overflow ahead of the messages that survived it
+        if self._dropped_messages:
+            self._output_console.display_log_message(
+                f"{self._dropped_messages} log messages dropped",
+                logging.WARNING,
+                __name__,
+            )
+            self._dropped_messages = 0
 
-        for message, level, logger_name in messages_to_process:
+        # Process all queued messages
+        while self._message_queue:
+            message, level, logger_name = self._message_queue.popleft()
             self._output_console.display_log_message(message, level, logger_name)
 
         # Stop timer if queue is empty
@@ -4,7 +4,22 @@ UI Dialogs for GRIMOIRE Design Studio.
 This package contains dialog windows used throughout the application.
 """
 
-from .flow_test_dialog import FlowTestDialog
-from .new_project import NewProjectDialog
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .flow_test_dialog import FlowTestDialog
+    from .new_project import NewProjectDialog
+
+# Exported names and the submodules defining them, imported on first access
+_EXPORTS = {
+    "FlowTestDialog": ".flow_test_dialog",
+    "NewProjectDialog": ".new_project",
+}
 
 __all__ = ["FlowTestDialog", "NewProjectDialog"]
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
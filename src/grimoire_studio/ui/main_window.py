@@ -5,6 +5,7 @@ This module provides the MainWindow class which serves as the primary applicatio
 interface with a three-panel layout for project browsing, editing, and properties.
 """
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -1556,7 +1557,7 @@ class MainWindow(QMainWindow):
                             message, "info", auto_switch=False
                         )
 
-                def on_user_input(step: Any, context: dict) -> Any:
+                def on_user_input(step: Any, context: Mapping[str, Any]) -> Any:
                     """Callback for user input/choice steps."""
                     from ..models.grimoire_definitions import FlowStep
 
@@ -5,6 +5,20 @@ This package contains view classes for different types of content editing
 including YAML editors, flow designers, and model editors.
 """
 
-from .yaml_editor_view import YamlEditorView
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .yaml_editor_view import YamlEditorView
+
+# Exported names and the submodules defining them, imported on first access
+_EXPORTS = {
+    "YamlEditorView": ".yaml_editor_view",
+}
 
 __all__ = ["YamlEditorView"]
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
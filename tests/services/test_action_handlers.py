@@ -28,6 +28,19 @@ from grimoire_studio.services.action_handlers.validate_value import (
 from grimoire_studio.services.exceptions import FlowExecutionError
 
 
+def _coerce_primitive(value: Any, expected_type: str | None, path: str) -> Any:
+    """Coerce a value the way flow execution coerces primitive path types."""
+    converters = {"str": str, "int": int, "float": float, "bool": bool}
+    if expected_type not in converters:
+        return value
+    try:
+        return converters[expected_type](value)
+    except (ValueError, TypeError) as e:
+        raise ValueError(
+            f"Cannot convert path '{path}' value '{value}' to type '{expected_type}'"
+        ) from e
+
+
 class MockTemplateResolver:
     """Mock template resolver for testing."""
 
@@ -291,6 +304,71 @@ class TestSetValueActionHandler:
                 on_action_execute=None,
             )
 
+    @pytest.mark.parametrize(
+        ("value", "expected_type", "stored"),
+        [
+            (5, "str", "5"),
+            (3.7, "int", 3),
+            (True, "int", 1),
+            ("7", "int", 7),
+        ],
+    )
+    def test_execute_literal_value_is_coerced(
+        self, value: Any, expected_type: str, stored: Any
+    ) -> None:
+        """Test that literals not of the expected type are coerced."""
+        # Arrange
+        handler = SetValueActionHandler(
+            type_getter=Mock(return_value=expected_type),
+            value_coercer=_coerce_primitive,
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        # Act
+        result_context = handler.execute(
+            action_data={"path": "character.value", "value": value},
+            context=context,
+            on_action_execute=None,
+        )
+
+        # Assert
+        stored_value = result_context.get_variable("character.value")
+        assert stored_value == stored
+        assert type(stored_value) is type(stored)
+
+    def test_execute_literal_value_failing_coercion_raises(self) -> None:
+        """Test that a literal that cannot be coerced raises an error."""
+        handler = SetValueActionHandler(
+            type_getter=Mock(return_value="int"),
+            value_coercer=_coerce_primitive,
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        with pytest.raises(FlowExecutionError, match="Cannot convert"):
+            handler.execute(
+                action_data={"path": "character.level", "value": None},
+                context=context,
+                on_action_execute=None,
+            )
+
+    def test_execute_value_of_expected_type_skips_coercion(self) -> None:
+        """Test that a value already of the expected type is stored as-is."""
+        mock_value_coercer = Mock(side_effect=_coerce_primitive)
+        handler = SetValueActionHandler(
+            type_getter=Mock(return_value="int"),
+            value_coercer=mock_value_coercer,
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        result_context = handler.execute(
+            action_data={"path": "character.level", "value": 5},
+            context=context,
+            on_action_execute=None,
+        )
+
+        assert result_context.get_variable("character.level") == 5
+        mock_value_coercer.assert_not_called()
+
 
 class TestSwapValuesActionHandler:
     """Tests for SwapValuesActionHandler."""
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import copy
+import json
+from collections.abc import Mapping
 from typing import Any, Callable
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from grimoire_context import GrimoireContext
+from grimoire_model import Jinja2TemplateResolver
 
 from grimoire_studio.models.grimoire_definitions import CompleteSystem, FlowStep
 from grimoire_studio.services.dice_service import DiceRollResult, DiceService
 from grimoire_studio.services.exceptions import FlowExecutionError
 from grimoire_studio.services.llm_service import LLMResult
 from grimoire_studio.services.name_service import NameService
+from grimoire_studio.services.step_executors import ContextView
 from grimoire_studio.services.step_executors.completion import CompletionStepExecutor
 from grimoire_studio.services.step_executors.dice_roll import DiceRollStepExecutor
 from grimoire_studio.services.step_executors.dice_sequence import (
@@ -30,7 +35,10 @@ from grimoire_studio.services.step_executors.player_choice import (
 from grimoire_studio.services.step_executors.player_input import (
     PlayerInputStepExecutor,
 )
-from grimoire_studio.services.step_executors.table_roll import TableRollStepExecutor
+from grimoire_studio.services.step_executors.table_roll import (
+    TableRollStepExecutor,
+    _parse_entry_ranges,
+)
 
 
 class MockTemplateResolver:
@@ -129,6 +137,27 @@ class TestDiceRollStepExecutor:
         mock_dice_service.roll_dice.assert_called_once_with("1d20+5")
         assert result_context.get_variable(f"{step_namespace}.result.total") == 18
 
+    def test_execute_literal_roll_skips_template_resolution(self) -> None:
+        """Test that a brace-free roll is not sent through the resolver."""
+        mock_dice_service = Mock(spec=DiceService)
+        mock_dice_service.roll_dice.return_value = DiceRollResult(
+            expression="3d6", total=11, description="3d6: [2, 4, 5] = 11"
+        )
+        executor = DiceRollStepExecutor(dice_service=mock_dice_service)
+        step = FlowStep(
+            id="roll4",
+            name="Literal Roll",
+            type="dice_roll",
+            step_config={"roll": "3d6"},
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        with patch.object(GrimoireContext, "resolve_template") as resolve_template:
+            executor.execute(step=step, context=context, step_namespace="steps.r")
+
+        resolve_template.assert_not_called()
+        mock_dice_service.roll_dice.assert_called_once_with("3d6")
+
     def test_execute_missing_roll_field(self) -> None:
         """Test error when roll field is missing."""
         # Arrange
@@ -211,6 +240,84 @@ class TestDiceSequenceStepExecutor:
             == "3d6: [4, 3, 5] = 12"
         )
 
+    def test_execute_sequence_in_flat_namespace(self) -> None:
+        """Test item and result storage in a flow-service style namespace."""
+        mock_dice_service = Mock(spec=DiceService)
+        mock_dice_service.roll_dice.side_effect = lambda expr: DiceRollResult(
+            expression=expr, total=len(expr), description=expr
+        )
+        rolls: list[str] = []
+
+        def recording_action_executor(
+            action: dict[str, Any],
+            ctx: GrimoireContext,
+            callback: Callable[[str, dict[str, Any]], None] | None,
+        ) -> GrimoireContext:
+            rolls.append(ctx.get_variable("step_abc.result.detail"))
+            return ctx
+
+        executor = DiceSequenceStepExecutor(
+            dice_service=mock_dice_service,
+            action_executor=recording_action_executor,
+        )
+        step = FlowStep(
+            id="seq2",
+            name="Roll Sequence",
+            type="dice_sequence",
+            step_config={
+                "sequence": {
+                    "items": ["str", "dex"],
+                    "roll": "1d6+{{item}}",
+                    "actions": [{"log_message": "rolled"}],
+                }
+            },
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+        context = context.set_variable("step_abc.config", {"keep": True})
+
+        result_context = executor.execute(step, context, "step_abc")
+
+        assert rolls == ["1d6+str", "1d6+dex"]
+        assert result_context.get_variable("step_abc.config") == {"keep": True}
+        assert result_context.get_variable("step_abc.item") == "dex"
+        assert result_context.get_variable("item") == "dex"
+        assert result_context.get_variable("result.detail") == "1d6+dex"
+
+    @pytest.mark.parametrize(
+        ("roll", "resolve_count"),
+        [("1d20+3", 0), ("1d20+{{bonus}}", 3)],
+    )
+    def test_execute_roll_template_resolved_per_item(
+        self, roll: str, resolve_count: int
+    ) -> None:
+        """Test that templated rolls are resolved per item, literal ones never."""
+        mock_dice_service = Mock(spec=DiceService)
+        mock_dice_service.roll_dice.return_value = DiceRollResult(
+            expression="1d20+3", total=15, description="1d20+3: [12] + 3 = 15"
+        )
+        resolver = MockTemplateResolver()
+        executor = DiceSequenceStepExecutor(
+            dice_service=mock_dice_service,
+            action_executor=lambda action, ctx, callback: ctx,
+        )
+        step = FlowStep(
+            id="seq3",
+            name="Roll Sequence",
+            type="dice_sequence",
+            step_config={"sequence": {"items": ["a", "b", "c"], "roll": roll}},
+        )
+        context = GrimoireContext(template_resolver=resolver)
+        context = context.set_variable("bonus", 3)
+
+        with patch.object(
+            resolver, "resolve_template", wraps=resolver.resolve_template
+        ) as resolve_template:
+            executor.execute(step, context, "step_abc")
+
+        assert resolve_template.call_count == resolve_count
+        assert mock_dice_service.roll_dice.call_count == 3
+        mock_dice_service.roll_dice.assert_called_with("1d20+3")
+
 
 class TestTableRollStepExecutor:
     """Tests for TableRollStepExecutor."""
@@ -278,6 +385,159 @@ class TestTableRollStepExecutor:
         assert result["entry"] == "gems"
         assert result["roll_result"]["total"] == 4
 
+    def test_execute_reuses_parsed_ranges(self) -> None:
+        """Test that entry ranges are parsed once and single values match."""
+        from grimoire_studio.models.grimoire_definitions import TableDefinition
+
+        mock_dice_service = Mock(spec=DiceService)
+        mock_dice_service.roll_dice.side_effect = [
+            DiceRollResult(expression="1d6", total=total, description=str(total))
+            for total in (6, 3, 5)
+        ]
+        table = TableDefinition(
+            id="loot",
+            kind="table",
+            name="Loot",
+            roll="1d6",
+            entries=[
+                {"range": "1-3", "value": "coins"},
+                {"range": "05", "value": "never"},
+                {"range": 5, "value": "gems"},
+                {"range": "6", "value": "sword"},
+            ],
+        )
+        system = Mock(spec=CompleteSystem)
+        system.tables = {"loot": table}
+        executor = TableRollStepExecutor(
+            system=system,
+            dice_service=mock_dice_service,
+            action_executor=lambda action, ctx, callback: ctx,
+        )
+        step = FlowStep(
+            id="table2",
+            name="Loot",
+            type="table_roll",
+            step_config={"tables": [{"table": "loot"}]},
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        with patch(
+            "grimoire_studio.services.step_executors.table_roll._parse_entry_ranges",
+            wraps=_parse_entry_ranges,
+        ) as parse_ranges:
+            entries = [
+                executor.execute(step, context, "step_abc").get_variable("result.entry")
+                for _ in range(3)
+            ]
+
+        assert entries == ["sword", "coins", "gems"]
+        parse_ranges.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("entries", "totals", "expected"),
+        [
+            # Disjoint ranges in any order are looked up by bisect
+            (
+                [
+                    {"range": "9-12", "value": "high"},
+                    {"range": "1-4", "value": "low"},
+                    {"range": "7", "value": "seven"},
+                ],
+                [1, 5, 7, 11],
+                ["low", "<no match for 5>", "seven", "high"],
+            ),
+            # Overlapping ranges keep first-match-in-entry-order semantics
+            (
+                [
+                    {"range": "3-9", "value": "wide"},
+                    {"range": "1-4", "value": "low"},
+                    {"range": "7", "value": "seven"},
+                ],
+                [1, 5, 7, 10],
+                ["low", "wide", "wide", "<no match for 10>"],
+            ),
+        ],
+    )
+    def test_execute_matches_ranges(
+        self, entries: list[dict[str, Any]], totals: list[int], expected: list[str]
+    ) -> None:
+        """Test entry matching for disjoint and overlapping ranges."""
+        from grimoire_studio.models.grimoire_definitions import TableDefinition
+
+        mock_dice_service = Mock(spec=DiceService)
+        mock_dice_service.roll_dice.side_effect = [
+            DiceRollResult(expression="1d12", total=total, description=str(total))
+            for total in totals
+        ]
+        system = Mock(spec=CompleteSystem)
+        system.tables = {
+            "t": TableDefinition(
+                id="t", kind="table", name="T", roll="1d12", entries=entries
+            )
+        }
+        executor = TableRollStepExecutor(
+            system=system,
+            dice_service=mock_dice_service,
+            action_executor=lambda action, ctx, callback: ctx,
+        )
+        step = FlowStep(
+            id="table3",
+            name="T",
+            type="table_roll",
+            step_config={"tables": [{"table": "t"}]},
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        results = [
+            executor.execute(step, context, "step_abc").get_variable("result.entry")
+            for _ in totals
+        ]
+
+        assert results == expected
+
+    def test_execute_independent_tables_store_last_result(self) -> None:
+        """Test that action-free tables are all rolled, storing the last result."""
+        from grimoire_studio.models.grimoire_definitions import TableDefinition
+
+        mock_dice_service = Mock(spec=DiceService)
+        mock_dice_service.roll_dice.side_effect = [
+            DiceRollResult(expression="1d6", total=total, description=str(total))
+            for total in (2, 5, 6)
+        ]
+        system = Mock(spec=CompleteSystem)
+        system.tables = {
+            name: TableDefinition(
+                id=name,
+                kind="table",
+                name=name,
+                roll="1d6",
+                entries=[{"range": "1-6", "value": name}],
+            )
+            for name in ("a", "b", "c")
+        }
+        executor = TableRollStepExecutor(
+            system=system,
+            dice_service=mock_dice_service,
+            action_executor=lambda action, ctx, callback: ctx,
+        )
+        step = FlowStep(
+            id="tables",
+            name="Tables",
+            type="table_roll",
+            step_config={"tables": [{"table": name} for name in ("a", "b", "c")]},
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        with patch.object(
+            GrimoireContext, "update", autospec=True, side_effect=GrimoireContext.update
+        ) as update:
+            result_context = executor.execute(step, context, "step_abc")
+
+        assert mock_dice_service.roll_dice.call_count == 3
+        update.assert_called_once()
+        assert result_context.get_variable("result.entry") == "c"
+        assert result_context.get_variable("step_abc.result.roll_result.total") == 6
+
 
 class TestPlayerInputStepExecutor:
     """Tests for PlayerInputStepExecutor."""
@@ -314,6 +574,30 @@ class TestPlayerInputStepExecutor:
         # Assert
         assert result_context.get_variable(f"{step_namespace}.result") == "Gandalf"
 
+    def test_callback_receives_read_only_context_view(self) -> None:
+        """Test that the callback sees context variables without a copy."""
+        executor = PlayerInputStepExecutor()
+        step = FlowStep(
+            id="input3",
+            name="Get Name",
+            type="player_input",
+            prompt="Enter your name:",
+        )
+        context = GrimoireContext({"hero": {"hp": 7}, "level": 2})
+        seen: dict[str, Any] = {}
+
+        def input_callback(step: FlowStep, ctx: Mapping[str, Any]) -> str:
+            assert isinstance(ctx, ContextView)
+            seen["hp"] = ctx["hero"]["hp"]
+            seen["snapshot"] = dict(ctx)
+            return "Aria"
+
+        with patch.object(GrimoireContext, "to_dict") as to_dict:
+            executor.execute(step, context, "step_abc", on_user_input=input_callback)
+
+        to_dict.assert_not_called()
+        assert seen == {"hp": 7, "snapshot": {"hero": {"hp": 7}, "level": 2}}
+
     def test_execute_without_callback_raises_error(self) -> None:
         """Test that missing callback raises error."""
         # Arrange
@@ -396,6 +680,24 @@ class TestPlayerChoiceStepExecutor:
         assert result["label"] == "Right"
         assert result["value"] == "right"
 
+    def test_execute_static_choices_leave_step_config_untouched(self) -> None:
+        """Test that static choices are not written back into the step."""
+        executor = PlayerChoiceStepExecutor(
+            template_resolver=Mock(),
+            action_executor=lambda action, ctx, callback: ctx,
+        )
+        step = FlowStep(
+            id="choice5",
+            name="Choose",
+            type="player_choice",
+            step_config={"prompt_text": "Which way?"},
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        executor.execute(step, context, "step_abc", on_user_input=lambda s, c: "left")
+
+        assert step.step_config == {"prompt_text": "Which way?"}
+
     def test_execute_dynamic_choices(self) -> None:
         """Test executing player choice with dynamic options from context."""
         # Arrange
@@ -452,6 +754,108 @@ class TestPlayerChoiceStepExecutor:
         result = result_context.get_variable(f"{step_namespace}.result")
         assert result["value"] == "sword"
 
+    def test_execute_choices_from_table_values(self) -> None:
+        """Test labelling choices generated from a dictionary in context."""
+        resolver = Jinja2TemplateResolver()
+        executor = PlayerChoiceStepExecutor(
+            template_resolver=resolver,
+            action_executor=lambda action, ctx, callback: ctx,
+        )
+        step = FlowStep(
+            id="choice3",
+            name="Choose Stat",
+            type="player_choice",
+            step_config={
+                "choice_source": {
+                    "table_from_values": "stats",
+                    "display_format": "{{ key }} = {{ value }} ({{ suffix }})",
+                }
+            },
+        )
+        context = GrimoireContext(template_resolver=resolver)
+        context = context.set_variable("stats", {"str": 14, "dex": 9})
+        context = context.set_variable("suffix", "base")
+
+        offered: list[dict[str, Any]] = []
+
+        def choice_callback(step: FlowStep, ctx: dict[str, Any]) -> str:
+            offered.extend(step.step_config["choices"])
+            return "dex"
+
+        result_context = executor.execute(
+            step, context, "step_abc", on_user_input=choice_callback
+        )
+
+        assert offered == [
+            {"id": "str", "label": "str = 14 (base)"},
+            {"id": "dex", "label": "dex = 9 (base)"},
+        ]
+        assert result_context.get_variable("step_abc.result") == "dex"
+        assert not result_context.has_variable("key")
+
+    def test_choice_source_path_read_without_template(self) -> None:
+        """Test that a dotted table_from_values path skips template rendering."""
+        resolver = Jinja2TemplateResolver()
+        executor = PlayerChoiceStepExecutor(
+            template_resolver=resolver,
+            action_executor=lambda action, ctx, callback: ctx,
+        )
+        step = FlowStep(
+            id="choice6",
+            name="Choose",
+            type="player_choice",
+            step_config={
+                "choice_source": {"table_from_values": "hero.stats"},
+            },
+        )
+        context = GrimoireContext(template_resolver=resolver)
+        context = context.set_variable("hero.stats", {"str": 14})
+
+        with patch.object(GrimoireContext, "resolve_template") as resolve_template:
+            executor.execute(
+                step, context, "step_abc", on_user_input=lambda s, c: "str"
+            )
+
+        resolve_template.assert_not_called()
+        assert step.step_config["choices"] == [{"id": "str", "label": "str: 14"}]
+
+        step.step_config["choice_source"]["table_from_values"] = "hero.missing"
+        with pytest.raises(FlowExecutionError, match="No data found at 'hero.missing'"):
+            executor.execute(step, context, "step_abc", on_user_input=lambda s, c: "x")
+
+    def test_execute_multi_selection(self) -> None:
+        """Test that multi-selection stores results and the first result."""
+        resolver = Jinja2TemplateResolver()
+        executor = PlayerChoiceStepExecutor(
+            template_resolver=resolver,
+            action_executor=lambda action, ctx, callback: ctx,
+        )
+        step = FlowStep(
+            id="choice4",
+            name="Choose Stats",
+            type="player_choice",
+            step_config={
+                "choice_source": {
+                    "table_from_values": "stats",
+                    "selection_count": 2,
+                }
+            },
+        )
+        context = GrimoireContext(template_resolver=resolver)
+        context = context.set_variable("stats", {"str": 14, "dex": 9, "con": 11})
+        context = context.set_variable("step_abc.config", {"keep": True})
+
+        result_context = executor.execute(
+            step, context, "step_abc", on_user_input=lambda s, c: ["con", "str"]
+        )
+
+        assert result_context.get_variable("step_abc") == {
+            "config": {"keep": True},
+            "results": ["con", "str"],
+            "result": "con",
+        }
+        assert result_context.get_variable("results") == ["con", "str"]
+
 
 class TestNameGenerationStepExecutor:
     """Tests for NameGenerationStepExecutor."""
@@ -541,6 +945,28 @@ class TestNameGenerationStepExecutor:
         )
         assert result_context.get_variable(f"{step_namespace}.result.name") == "Elrond"
 
+    @patch("grimoire_studio.services.step_executors.name_generation.NameService")
+    def test_execute_reuses_name_service(self, mock_name_service_class: Mock) -> None:
+        """Test that one name service is built per corpus and segmenter."""
+        mock_name_service_class.return_value.generate_name.return_value = "Bilbo"
+        executor = NameGenerationStepExecutor()
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        def step(corpus: str) -> FlowStep:
+            return FlowStep(
+                id="name",
+                name="Generate Name",
+                type="name_generation",
+                step_config={"settings": {"corpus": corpus}},
+            )
+
+        executor.execute(step("generic-fantasy"), context, "steps.a")
+        executor.execute(step("generic-fantasy"), context, "steps.b")
+        assert mock_name_service_class.call_count == 1
+
+        executor.execute(step("japanese-sengoku"), context, "steps.c")
+        assert mock_name_service_class.call_count == 2
+
 
 class TestLLMGenerationStepExecutor:
     """Tests for LLMGenerationStepExecutor."""
@@ -605,6 +1031,45 @@ class TestLLMGenerationStepExecutor:
         result = result_context.get_variable(f"{step_namespace}.result")
         assert result == "A majestic red dragon with scales like rubies"
 
+    def test_execute_reuses_applied_llm_config(self) -> None:
+        """Test that unchanged LLM settings are not re-applied every step."""
+        from grimoire_studio.models.grimoire_definitions import PromptDefinition
+        from grimoire_studio.services.llm_service import LLMConfig, LLMService
+
+        llm_service = LLMService()
+        mock_prompt = Mock(spec=PromptDefinition)
+        mock_prompt.prompt_template = "Describe a dragon"
+        mock_prompt.llm = {"provider": "mock", "model": "mock-model"}
+        mock_system = Mock(spec=CompleteSystem)
+        mock_system.prompts = {"describe": mock_prompt}
+
+        executor = LLMGenerationStepExecutor(
+            system=mock_system,
+            llm_service=llm_service,
+            template_dict_resolver=lambda template_dict, ctx: template_dict,
+        )
+        step = FlowStep(
+            id="llm1",
+            name="Generate",
+            type="llm_generation",
+            step_config={"prompt_id": "describe"},
+        )
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        with patch.object(
+            llm_service, "set_config", wraps=llm_service.set_config
+        ) as set_config:
+            executor.execute(step, context, "steps.a")
+            executor.execute(step, context, "steps.b")
+            assert set_config.call_count == 1
+
+            # A config applied by someone else is replaced again
+            LLMService.set_config(llm_service, LLMConfig(model="other"))
+            executor.execute(step, context, "steps.c")
+            assert set_config.call_count == 2
+
+        assert llm_service.get_config().model == "mock-model"
+
     def test_execute_with_template_prompt(self) -> None:
         """Test LLM generation with template in prompt."""
         # Arrange
@@ -714,6 +1179,24 @@ class TestCompletionStepExecutor:
         result = result_context.get_variable(f"{step_namespace}.result")
         assert result["completed"] is True
 
+    def test_execute_completion_result_is_plain_dict(self) -> None:
+        """Test that each completion step stores its own serializable dict."""
+        executor = CompletionStepExecutor()
+        step = FlowStep(id="complete3", name="Complete", type="completion")
+        context = GrimoireContext(template_resolver=MockTemplateResolver())
+
+        first = executor.execute(step, context, "steps.a").get_variable(
+            "steps.a.result"
+        )
+        second = executor.execute(step, context, "steps.b").get_variable(
+            "steps.b.result"
+        )
+
+        assert isinstance(first, dict)
+        assert first is not second
+        assert json.loads(json.dumps(first)) == {"completed": True}
+        assert copy.deepcopy(second) == {"completed": True}
+
     def test_execute_completion_without_object(self) -> None:
         """Test completion without output object."""
         # Arrange
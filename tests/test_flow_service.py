@@ -1,6 +1,9 @@
 """Tests for FlowExecutionService."""
 
+from collections import OrderedDict
+
 import pytest
+from grimoire_context import GrimoireContext
 
 from grimoire_studio.models.grimoire_definitions import (
     AttributeDefinition,
@@ -849,6 +852,34 @@ class TestCallbacks:
         assert "log_message" in actions_executed
         assert "set_value" in actions_executed
 
+    def test_actions_without_callback(self, flow_service, sample_system):
+        """Test that actions run when no on_action_execute callback is given."""
+        flow = FlowDefinition(
+            id="no_callback_flow",
+            kind="flow",
+            name="No Callback Flow",
+            steps=[
+                FlowStep(
+                    id="step1",
+                    name="Step 1",
+                    type="completion",
+                    actions=[
+                        {"display_message": "Shown nowhere"},
+                        {"set_value": {"path": "outputs.test", "value": "test"}},
+                    ],
+                )
+            ],
+            outputs=[
+                FlowInputOutput(type="str", id="test", validate=False),
+            ],
+        )
+
+        sample_system.flows["no_callback_flow"] = flow
+
+        result = flow_service.execute_flow("no_callback_flow")
+
+        assert result["test"] == "test"
+
 
 class TestContextManagement:
     """Test cases for context management."""
@@ -912,6 +943,34 @@ class TestContextManagement:
         assert flow_service.current_context is None
         assert flow_service.current_flow is None
 
+    def test_step_namespaces_unique(self, flow_service, sample_system):
+        """Test that every step execution gets its own namespace."""
+        flow = FlowDefinition(
+            id="namespace_flow",
+            kind="flow",
+            name="Namespace Flow",
+            steps=[
+                FlowStep(id="first", name="First", type="completion"),
+                FlowStep(id="second", name="Second", type="completion"),
+            ],
+        )
+        sample_system.flows["namespace_flow"] = flow
+
+        executor = flow_service._step_executors["completion"]
+        execute = executor.execute
+        namespaces = []
+
+        def recording_execute(step, context, step_namespace, *args):
+            namespaces.append(step_namespace)
+            return execute(step, context, step_namespace, *args)
+
+        executor.execute = recording_execute
+        flow_service.execute_flow("namespace_flow")
+        flow_service.execute_flow("namespace_flow")
+
+        assert len(set(namespaces)) == 4
+        assert all(ns.startswith("step_") and "." not in ns for ns in namespaces)
+
 
 class TestTypeCoercion:
     """Tests for automatic type coercion in flow actions."""
@@ -1287,3 +1346,126 @@ class TestTypeCoercion:
         # Most importantly: level and hp should have their default values
         assert result["hero"]["level"] == 1  # Default from model
         assert result["hero"]["hp"] == 10  # Default from model
+
+
+class TestTemplateResolutionInDict:
+    """Test cases for recursive template resolution in dictionaries."""
+
+    def test_resolves_nested_values_and_subclasses(self, flow_service):
+        """Test that strings, dicts, lists and their subclasses are resolved."""
+
+        class Label(str):
+            pass
+
+        context = GrimoireContext({"name": "Aria", "level": 3})
+        context = context.set_template_resolver(flow_service.template_resolver)
+
+        data = {
+            "title": "{{ name }}",
+            "label": Label("Lvl {{ level }}"),
+            "nested": OrderedDict(greeting="Hi {{ name }}"),
+            "items": ["{{ name }}", {"lvl": "{{ level }}"}, ["{{ name }}"], 7],
+            "count": 5,
+        }
+
+        result = flow_service._resolve_templates_in_dict(data, context)
+
+        assert result == {
+            "title": "Aria",
+            "label": "Lvl 3",
+            "nested": {"greeting": "Hi Aria"},
+            # Lists nested directly in lists are passed through unchanged
+            "items": ["Aria", {"lvl": 3}, ["{{ name }}"], 7],
+            "count": 5,
+        }
+
+
+class TestModelCoercionCache:
+    """Test cases for caching of model coercion results."""
+
+    def test_identical_model_payloads_instantiated_once(
+        self, flow_service, sample_system, object_service, monkeypatch
+    ):
+        """Test that repeated identical model assignments reuse one instance."""
+        hero_data = {"model": "character", "name": "Twin"}
+        flow = FlowDefinition(
+            id="coerce_cache_flow",
+            kind="flow",
+            name="Coerce Cache Flow",
+            variables=[
+                FlowVariable(type="character", id="first", validate=False),
+                FlowVariable(type="character", id="second", validate=False),
+            ],
+            outputs=[
+                FlowInputOutput(type="character", id="first", validate=False),
+                FlowInputOutput(type="character", id="second", validate=False),
+            ],
+            steps=[
+                FlowStep(
+                    id="assign",
+                    name="Assign",
+                    type="completion",
+                    actions=[
+                        {"set_value": {"path": "variables.first", "value": hero_data}},
+                        {"set_value": {"path": "variables.second", "value": hero_data}},
+                        {
+                            "set_value": {
+                                "path": "outputs.first",
+                                "value": "{{ variables.first }}",
+                            }
+                        },
+                        {
+                            "set_value": {
+                                "path": "outputs.second",
+                                "value": "{{ variables.second }}",
+                            }
+                        },
+                    ],
+                ),
+            ],
+        )
+        sample_system.flows["coerce_cache_flow"] = flow
+
+        calls = []
+        original_create = object_service.create_object
+
+        def counting_create(data):
+            calls.append(data)
+            return original_create(data)
+
+        monkeypatch.setattr(object_service, "create_object", counting_create)
+
+        result = flow_service.execute_flow("coerce_cache_flow")
+
+        # The two literal assignments share one instantiation; the resolved
+        # outputs carry defaults and therefore form a distinct payload
+        assert calls.count(hero_data) == 1
+        assert result["first"] == result["second"]
+        assert result["first"] is not result["second"]
+        assert result["first"]["level"] == 1
+        assert flow_service._model_coerce_cache == {}
+
+    @pytest.mark.parametrize(
+        ("first", "second"),
+        [
+            ({"a": 1}, {"a": 1.0}),
+            ({"a": 1}, {"a": True}),
+            ({"a": [1, 2]}, {"a": (1, 2)}),
+            ({"a": "1"}, {"a": 1}),
+        ],
+    )
+    def test_cache_key_keeps_types_distinct(self, first, second):
+        """Test that payloads equal only across types get separate keys."""
+        first_key = FlowExecutionService._model_coerce_key("character", first)
+        second_key = FlowExecutionService._model_coerce_key("character", second)
+
+        assert first_key is not None
+        assert second_key is not None
+        assert first_key != second_key
+
+    def test_cache_key_skips_unsupported_values(self):
+        """Test that payloads holding arbitrary objects are not cached."""
+        assert FlowExecutionService._model_coerce_key("character", {"a": {1}}) is None
+        assert (
+            FlowExecutionService._model_coerce_key("character", {"a": object()}) is None
+        )
@@ -4,9 +4,17 @@ Tests for the LLM Service.
 This module tests the LLM prompt execution functionality.
 """
 
+import asyncio
+import gc
+import json
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
-from grimoire_studio.services import LLMConfig, LLMResult, LLMService
+from grimoire_studio.services import LLMConfig, LLMResult, LLMService, SemanticCache
+from grimoire_studio.services.llm_service import _count_words, format_prompt
 
 
 class TestLLMConfig:
@@ -153,6 +161,76 @@ class TestLLMService:
         assert result is not None
         # The prompt should have been processed with variables
 
+    @pytest.mark.parametrize(
+        ("prompt", "variables"),
+        [
+            ("The {color} {item} is worth {value} gold", {"color": "red"}),
+            ("Literal {{braces}} around {item}", {"item": "gem"}),
+            ("Padded {value:>5} and {item!r}", {"value": 3, "item": "gem"}),
+            ("Attribute {item.real}", {"item": 5}),
+            ("No placeholders at all", {"item": "gem"}),
+            ("Escaped {{braces}} only", {}),
+            ("Closing }} only", {}),
+        ],
+    )
+    def test_substitution_matches_str_format(self, prompt, variables):
+        """Test that substitution agrees with str.format."""
+        service = LLMService()
+        variables = {"item": "gem", "value": 100, **variables}
+
+        result = service.execute_prompt(prompt, variables=variables)
+
+        assert result.prompt == prompt.format(**variables)
+
+    def test_malformed_template(self):
+        """Test that an unbalanced brace is reported."""
+        service = LLMService()
+
+        with pytest.raises(ValueError):
+            service.execute_prompt("Broken {item", {"item": "gem"})
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "one",
+            "Generate a fantasy sword",
+            " leading and trailing ",
+            "double  spaced words",
+            "multi\nline\tprompt text",
+            "non\u00a0breaking space",
+            "   ",
+        ],
+    )
+    def test_count_words_matches_split(self, text):
+        """Test that the word count agrees with str.split."""
+        assert _count_words(text) == len(text.split())
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "No placeholders",
+            "Describe a {creature}",
+            "A {color} {creature} with {{braces}}",
+            "Level {level:>3} {creature!r}",
+            "{stats[str]} strength",
+        ],
+    )
+    def test_format_prompt_matches_str_format(self, template):
+        """Test that format_prompt agrees with str.format."""
+        variables = {
+            "creature": "dragon",
+            "color": "red",
+            "level": 7,
+            "stats": {"str": 18},
+        }
+        assert format_prompt(template, variables) == template.format(**variables)
+
+    def test_format_prompt_missing_variable(self):
+        """Test that a missing variable raises KeyError like str.format."""
+        with pytest.raises(KeyError, match="creature"):
+            format_prompt("Describe a {creature}", {})
+
     def test_get_config(self):
         """Test getting current configuration."""
         config = LLMConfig(
@@ -290,3 +368,435 @@ class TestLLMService:
             config = LLMConfig(provider="mock", max_tokens=tokens)
             service = LLMService(config=config)
             assert service.get_config().max_tokens == tokens
+
+
+class TestLLMServiceBatch:
+    """Test cases for synchronous batch execution."""
+
+    def test_execute_prompts_preserves_order(self):
+        """Test that batched results line up with their prompts."""
+        service = LLMService()
+        prompts = [f"Prompt number {i}" for i in range(10)]
+
+        results = service.execute_prompts(prompts, concurrency=4)
+
+        assert [result.prompt for result in results] == prompts
+
+    def test_execute_prompts_with_variables(self):
+        """Test batched execution with per-prompt variables."""
+        service = LLMService()
+
+        results = service.execute_prompts(
+            ["A {kind}", "A {kind}"], [{"kind": "sword"}, {"kind": "shield"}]
+        )
+
+        assert [result.prompt for result in results] == ["A sword", "A shield"]
+
+    def test_execute_prompts_empty(self):
+        """Test that an empty batch returns no results."""
+        assert LLMService().execute_prompts([]) == []
+
+    def test_execute_prompts_propagates_errors(self):
+        """Test that a failing prompt fails the batch."""
+        service = LLMService()
+
+        with pytest.raises(ValueError, match="Prompt cannot be empty"):
+            service.execute_prompts(["valid", ""])
+
+    def test_execute_prompts_invalid_arguments(self):
+        """Test validation of batched execution arguments."""
+        service = LLMService()
+
+        with pytest.raises(ValueError, match="one entry per prompt"):
+            service.execute_prompts(["a", "b"], [None])
+        with pytest.raises(ValueError, match="Concurrency"):
+            service.execute_prompts(["a"], concurrency=0)
+
+
+class TestLLMServiceAsync:
+    """Test cases for concurrent prompt execution."""
+
+    def test_aexecute_prompt(self):
+        """Test executing a single prompt asynchronously."""
+        service = LLMService()
+
+        result = asyncio.run(
+            service.aexecute_prompt("Generate a {item}", {"item": "sword"})
+        )
+
+        assert result.prompt == "Generate a sword"
+        assert result.provider == "mock"
+
+    def test_aexecute_prompts_preserves_order(self):
+        """Test that batched results line up with their prompts."""
+        service = LLMService()
+        prompts = [f"Prompt number {i}" for i in range(10)]
+
+        results = asyncio.run(service.aexecute_prompts(prompts, concurrency=3))
+
+        assert [result.prompt for result in results] == prompts
+
+    def test_aexecute_prompts_with_variables(self):
+        """Test batched execution with per-prompt variables."""
+        service = LLMService()
+
+        results = asyncio.run(
+            service.aexecute_prompts(
+                ["A {kind}", "A {kind}"], [{"kind": "sword"}, {"kind": "shield"}]
+            )
+        )
+
+        assert [result.prompt for result in results] == ["A sword", "A shield"]
+
+    def test_aexecute_prompts_invalid_arguments(self):
+        """Test validation of batched execution arguments."""
+        service = LLMService()
+
+        with pytest.raises(ValueError, match="one entry per prompt"):
+            asyncio.run(service.aexecute_prompts(["a", "b"], [None]))
+        with pytest.raises(ValueError, match="Concurrency"):
+            asyncio.run(service.aexecute_prompts(["a"], concurrency=0))
+
+
+class TestLLMServiceBatchWithCache:
+    """Test cases for deduplicated, cache-aware batch execution."""
+
+    def test_duplicates_are_executed_once(self, ollama_server):
+        """Test that each distinct prompt reaches the provider once."""
+        port = ollama_server.server_address[1]
+        config = LLMConfig(
+            provider="ollama", temperature=0.9, base_url=f"http://127.0.0.1:{port}"
+        )
+        service = LLMService(config)
+        prompts = ["Name a sword", "Name a shield", "Name a sword"]
+
+        results = asyncio.run(service.abatch_with_cache(prompts))
+
+        assert [result.response for result in results] == [
+            "echo: Name a sword",
+            "echo: Name a shield",
+            "echo: Name a sword",
+        ]
+        assert len(ollama_server.requests) == 2
+
+    def test_cached_prompts_are_not_executed(self, ollama_server):
+        """Test that cache hits skip the provider."""
+        port = ollama_server.server_address[1]
+        config = LLMConfig(
+            provider="ollama", temperature=0.0, base_url=f"http://127.0.0.1:{port}"
+        )
+        service = LLMService(config)
+        service.execute_prompt("Name a sword")
+
+        results = asyncio.run(
+            service.abatch_with_cache(["Name a sword", "Name a shield"])
+        )
+
+        assert results[0].metadata == {"cached": True}
+        assert results[1].metadata == {}
+        assert len(ollama_server.requests) == 2
+
+    def test_empty_prompt_rejected(self):
+        """Test that an empty prompt fails the whole batch."""
+        with pytest.raises(ValueError, match="Prompt cannot be empty"):
+            asyncio.run(LLMService().abatch_with_cache(["valid", ""]))
+
+
+class _FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Minimal Ollama API stand-in that records client connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.tag_checks += 1
+        self._send_json({"models": []})
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        request = json.loads(self.rfile.read(length))
+        self.server.requests.append(request)
+        response = f"echo: {request['prompt']}"
+
+        # Newline-delimited JSON, one chunk per word, like Ollama
+        words = response.split(" ")
+        chunks = [
+            {"response": word if i == 0 else f" {word}", "done": False}
+            for i, word in enumerate(words)
+        ]
+        chunks.append({"response": "", "done": True})
+        body = b"".join(json.dumps(chunk).encode("utf-8") + b"\n" for chunk in chunks)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def ollama_server():
+    """Run a fake Ollama server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllamaHandler)
+    server.connections = 0
+    server.requests = []
+    server.tag_checks = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestLLMServiceOllama:
+    """Test cases for the Ollama provider against a local fake server."""
+
+    def test_execute_prompt_reuses_connection(self, ollama_server):
+        """Test that consecutive prompts share one keep-alive connection."""
+        port = ollama_server.server_address[1]
+        config = LLMConfig(
+            provider="ollama", model="llama2", base_url=f"http://127.0.0.1:{port}"
+        )
+        service = LLMService(config)
+
+        first = service.execute_prompt("First prompt")
+        second = service.execute_prompt("Second prompt")
+
+        assert first.response == "echo: First prompt"
+        assert second.response == "echo: Second prompt"
+        assert ollama_server.requests[0]["model"] == "llama2"
+        assert ollama_server.connections == 1
+
+    def test_execute_prompts_closes_worker_connections(self, ollama_server):
+        """Test that pooled connections close when batch workers exit."""
+        port = ollama_server.server_address[1]
+        config = LLMConfig(provider="ollama", base_url=f"http://127.0.0.1:{port}")
+        service = LLMService(config)
+        prompts = [f"Prompt {i}" for i in range(8)]
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            results = service.execute_prompts(prompts, concurrency=4)
+            gc.collect()
+
+        assert [result.response for result in results] == [
+            f"echo: {prompt}" for prompt in prompts
+        ]
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+    def test_stream_prompt_yields_chunks(self, ollama_server):
+        """Test that streamed responses arrive chunk by chunk."""
+        port = ollama_server.server_address[1]
+        config = LLMConfig(provider="ollama", base_url=f"http://127.0.0.1:{port}")
+        service = LLMService(config)
+
+        chunks = list(service.stream_prompt("Describe a {place}", {"place": "inn"}))
+
+        assert chunks == ["echo:", " Describe", " a", " inn"]
+        assert ollama_server.requests[0]["stream"] is True
+
+    def test_stream_prompt_mock_provider(self):
+        """Test that the mock provider streams a single chunk."""
+        service = LLMService()
+
+        chunks = list(service.stream_prompt("Test prompt"))
+
+        assert len(chunks) == 1
+        assert "[MOCK RESPONSE]" in chunks[0]
+
+    def test_stream_prompt_connection_error(self):
+        """Test that streaming failures raise RuntimeError."""
+        config = LLMConfig(provider="ollama", base_url="http://127.0.0.1:9")
+        service = LLMService(config)
+
+        with pytest.raises(RuntimeError, match="LLM streaming failed"):
+            list(service.stream_prompt("Test prompt"))
+
+    def test_per_call_generation_overrides(self, ollama_server):
+        """Test that per-call settings reach the request options."""
+        port = ollama_server.server_address[1]
+        config = LLMConfig(
+            provider="ollama",
+            temperature=0.7,
+            max_tokens=500,
+            base_url=f"http://127.0.0.1:{port}",
+        )
+        service = LLMService(config)
+
+        service.execute_prompt("Name a tavern", max_tokens=10, temperature=0.0)
+        service.execute_prompt("Describe a tavern")
+
+        assert ollama_server.requests[0]["options"] == {
+            "temperature": 0.0,
+            "num_predict": 10,
+        }
+        assert ollama_server.requests[1]["options"] == {
+            "temperature": 0.7,
+            "num_predict": 500,
+        }
+
+    def test_per_call_overrides_scope_cache(self, ollama_server):
+        """Test that cached responses are keyed by per-call settings."""
+        port = ollama_server.server_address[1]
+        config = LLMConfig(
+            provider="ollama", temperature=0.0, base_url=f"http://127.0.0.1:{port}"
+        )
+        service = LLMService(config)
+
+        service.execute_prompt("Name a tavern", max_tokens=10)
+        service.execute_prompt("Name a tavern", max_tokens=20)
+        cached = service.execute_prompt("Name a tavern", max_tokens=10)
+
+        assert len(ollama_server.requests) == 2
+        assert cached.metadata == {"cached": True}
+
+    def test_invalid_max_tokens_override(self):
+        """Test that a non-positive token budget is rejected."""
+        with pytest.raises(ValueError, match="max_tokens"):
+            LLMService().execute_prompt("Name a tavern", max_tokens=0)
+
+    def test_is_ollama_available(self, ollama_server):
+        """Test availability check against a running server."""
+        port = ollama_server.server_address[1]
+
+        assert LLMService.is_ollama_available(f"http://127.0.0.1:{port}") is True
+
+    def test_is_ollama_unavailable(self):
+        """Test availability check when nothing is listening."""
+        assert LLMService.is_ollama_available("http://127.0.0.1:9") is False
+
+    def test_is_ollama_available_is_cached(self, ollama_server):
+        """Test that availability is cached until the TTL expires."""
+        base_url = f"http://127.0.0.1:{ollama_server.server_address[1]}"
+
+        assert LLMService.is_ollama_available(base_url, ttl=0) is True
+        assert LLMService.is_ollama_available(base_url) is True
+        assert ollama_server.tag_checks == 1
+
+        assert LLMService.is_ollama_available(base_url, ttl=0) is True
+        assert ollama_server.tag_checks == 2
+
+
+class TestLLMServiceResponseCache:
+    """Test cases for the exact-match response cache."""
+
+    def test_deterministic_prompt_is_cached(self, ollama_server):
+        """Test that a repeated low-temperature prompt skips the provider."""
+        port = ollama_server.server_address[1]
+        config = LLMConfig(
+            provider="ollama", temperature=0.0, base_url=f"http://127.0.0.1:{port}"
+        )
+        service = LLMService(config)
+
+        first = service.execute_prompt("Name a {item}", {"item": "sword"})
+        second = service.execute_prompt("Name a {item}", {"item": "sword"})
+
+        assert second.response == first.response
+        assert second.metadata == {"cached": True}
+        assert len(ollama_server.requests) == 1
+
+    def test_high_temperature_prompt_is_not_cached(self, ollama_server):
+        """Test that sampled prompts always reach the provider."""
+        port = ollama_server.server_address[1]
+        config = LLMConfig(
+            provider="ollama", temperature=0.9, base_url=f"http://127.0.0.1:{port}"
+        )
+        service = LLMService(config)
+
+        service.execute_prompt("Name a sword")
+        service.execute_prompt("Name a sword")
+
+        assert len(ollama_server.requests) == 2
+
+    def test_config_change_misses_cache(self):
+        """Test that cached responses are scoped to the config."""
+        service = LLMService(LLMConfig(temperature=0.0))
+        service.execute_prompt("Name a sword")
+
+        service.set_config(LLMConfig(temperature=0.0, max_tokens=10))
+        result = service.execute_prompt("Name a sword")
+
+        assert result.metadata == {}
+
+    def test_clear_cache(self):
+        """Test that clearing the cache forces re-execution."""
+        service = LLMService(LLMConfig(temperature=0.0))
+        service.execute_prompt("Name a sword")
+        assert service.execute_prompt("Name a sword").metadata == {"cached": True}
+
+        service.clear_cache()
+
+        assert service.execute_prompt("Name a sword").metadata == {}
+
+
+def _bag_of_words_embedder(text):
+    """Embed text as word counts over a tiny fixed vocabulary."""
+    vocabulary = ("name", "a", "sword", "shield", "for", "knight")
+    words = text.lower().split()
+    return [float(words.count(word)) for word in vocabulary]
+
+
+class TestSemanticCache:
+    """Test cases for the semantic similarity cache."""
+
+    def test_lookup_matches_similar_prompt(self):
+        """Test that a rephrased prompt hits the cache."""
+        cache = SemanticCache(_bag_of_words_embedder, threshold=0.95)
+        cache.store("scope", "Name a sword", "Dawnbreaker")
+
+        assert cache.lookup("scope", "name  a   SWORD") == "Dawnbreaker"
+        assert cache.lookup("scope", "Name a shield") is None
+
+    def test_lookup_respects_scope(self):
+        """Test that entries are not shared across scopes."""
+        cache = SemanticCache(_bag_of_words_embedder)
+        cache.store("scope-a", "Name a sword", "Dawnbreaker")
+
+        assert cache.lookup("scope-b", "Name a sword") is None
+
+    def test_eviction(self):
+        """Test that the oldest entry is evicted when full."""
+        cache = SemanticCache(_bag_of_words_embedder, max_entries=1)
+        cache.store("scope", "Name a sword", "Dawnbreaker")
+        cache.store("scope", "Name a shield", "Aegis")
+
+        assert len(cache) == 1
+        assert cache.lookup("scope", "Name a sword") is None
+
+    def test_invalid_threshold(self):
+        """Test that an out-of-range threshold is rejected."""
+        with pytest.raises(ValueError, match="Threshold"):
+            SemanticCache(_bag_of_words_embedder, threshold=1.5)
+
+    def test_service_uses_semantic_cache(self):
+        """Test that LLMService serves near-duplicates when enabled."""
+        config = LLMConfig(temperature=0.0, enable_semantic_cache=True)
+        service = LLMService(config, embedder=_bag_of_words_embedder)
+
+        first = service.execute_prompt("Name a sword")
+        second = service.execute_prompt("name a  sword")
+
+        assert second.response == first.response
+        assert second.metadata == {"cached": True}
+
+    def test_service_requires_embedder(self):
+        """Test that enabling the semantic cache needs an embedder."""
+        config = LLMConfig(enable_semantic_cache=True)
+
+        with pytest.raises(ValueError, match="embedder"):
+            LLMService(config)
+        with pytest.raises(ValueError, match="embedder"):
+            LLMService().set_config(config)
@@ -4,6 +4,10 @@ Tests for the Name Service.
 This module tests the name generation functionality using wyrdbound-rng.
 """
 
+import random
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from grimoire_studio.services import NameService
@@ -114,6 +118,22 @@ class TestNameService:
         # Very unlikely to be identical with different seeds
         assert names1 != names2
 
+    def test_seeded_services_are_independent(self):
+        """Test that seeded services do not share or disturb random state."""
+        expected = NameService(seed=42).generate_names(count=5)
+
+        random.seed(0)
+        global_state = random.getstate()
+        service1 = NameService(seed=42)
+        service2 = NameService(seed=42)
+        interleaved = []
+        for _ in range(5):
+            interleaved.append(service1.generate_names(count=1)[0])
+            service2.generate_names(count=1)
+
+        assert interleaved == expected
+        assert random.getstate() == global_state
+
     def test_invalid_name_type(self):
         """Test generating with invalid name type - now ignored by wyrdbound-rng."""
         service = NameService()
@@ -242,6 +262,54 @@ class TestNameService:
         assert all(isinstance(name, str) for name in names)
         assert all(len(name) > 0 for name in names)
 
+    def test_repeated_generate_name_is_batched(self, monkeypatch):
+        """Test that repeated calls are served from growing batches."""
+        service = NameService(seed=7)
+        batch_sizes = []
+        original_generate = service.generator.generate
+
+        def recording_generate(n, **kwargs):
+            batch_sizes.append(n)
+            return original_generate(n=n, **kwargs)
+
+        monkeypatch.setattr(service.generator, "generate", recording_generate)
+
+        names = [service.generate_name(max_length=10) for _ in range(100)]
+
+        assert len(names) == 100
+        assert all(len(name) <= 10 for name in names)
+        assert batch_sizes[:6] == [1, 2, 4, 8, 16, 32]
+        assert len(batch_sizes) < 10
+
+    def test_generate_name_argument_change_discards_buffer(self):
+        """Test that changing arguments does not serve stale names."""
+        service = NameService(seed=7)
+        for _ in range(4):
+            service.generate_name(max_length=15)
+
+        names = [service.generate_name(max_length=5) for _ in range(10)]
+
+        assert all(len(name) <= 5 for name in names)
+
+    def test_generate_name_from_threads(self, monkeypatch):
+        """Test that threads sharing a service are each served a fresh name."""
+        service = NameService(seed=7)
+        produced: list[str] = []
+        original_generate = service.generator.generate
+
+        def recording_generate(n, **kwargs):
+            results = original_generate(n=n, **kwargs)
+            produced.extend(str(result.name) for result in results)
+            return results
+
+        monkeypatch.setattr(service.generator, "generate", recording_generate)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            names = list(executor.map(lambda _: service.generate_name(), range(200)))
+
+        assert len(names) == 200
+        assert Counter(names) + Counter(service._buffer) == Counter(produced)
+
     def test_invalid_segmenter(self):
         """Test initialization with invalid segmenter raises error."""
         with pytest.raises(ValueError, match="Unsupported segmenter"):
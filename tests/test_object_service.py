@@ -1,5 +1,7 @@
 """Tests for ObjectInstantiationService - simplified for grimoire-model integration."""
 
+import gc
+
 import pytest
 
 from grimoire_studio.models.grimoire_definitions import (
@@ -42,6 +44,16 @@ class TestObjectInstantiationService:
         service = ObjectInstantiationService(sample_system)
         assert service.system == sample_system
 
+    def test_service_registers_system_models(self, sample_system):
+        """Test that every system model is registered under the system ID."""
+        from grimoire_studio.services.object_service import ObjectInstantiationService
+
+        service = ObjectInstantiationService(sample_system)
+        namespace = sample_system.system.id
+
+        for model_id, model_def in sample_system.models.items():
+            assert service.model_registry.get(namespace, model_id) is model_def
+
     def test_create_object_invalid_data_type(self, sample_system):
         """Test create_object with invalid data type."""
         from grimoire_studio.services.object_service import ObjectInstantiationService
@@ -71,6 +83,23 @@ class TestObjectInstantiationService:
         with pytest.raises(ValueError, match="Unknown model type: dragon"):
             service.create_object(data)
 
+    def test_validate_object_follows_model_changes(self, sample_system):
+        """Test that the model type is read from the data on every call."""
+        from grimoire_studio.services.object_service import ObjectInstantiationService
+
+        service = ObjectInstantiationService(sample_system)
+        data = {"model": "dragon", "name": "Smaug"}
+
+        assert service.validate_object(data) == (
+            False,
+            ["Unknown model type: dragon"],
+        )
+
+        data["model"] = 42
+        is_valid, errors = service.validate_object(data)
+        assert not is_valid
+        assert errors[0].startswith("Model field must be a string")
+
 
 @pytest.fixture
 def sample_flow_system():
@@ -265,6 +294,89 @@ class TestFlowInstantiation:
         # temp_value should not be validated (validate=False)
         assert result["temp_value"] == 42
 
+    def test_instantiate_flow_input_model_tagging(self, sample_flow_system):
+        """Test that model values are tagged without touching caller data."""
+        from grimoire_studio.services.object_service import ObjectInstantiationService
+
+        service = ObjectInstantiationService(sample_flow_system)
+        flow_def = sample_flow_system.flows["test_flow"]
+        service.create_object = lambda data: data
+
+        untagged = {"name": "Hero"}
+        result = service.instantiate_flow_input(
+            flow_def, {"player_name": "Hero", "player_char": untagged}
+        )
+        assert result["player_char"] == {"model": "character", "name": "Hero"}
+        assert untagged == {"name": "Hero"}
+
+        tagged = {"model": "character", "name": "Hero"}
+        result = service.instantiate_flow_input(
+            flow_def, {"player_name": "Hero", "player_char": tagged}
+        )
+        assert result["player_char"] is tagged
+
+    def test_instantiate_flow_input_invalid_primitive(self, sample_flow_system):
+        """Test that a bad primitive input names the input in the error."""
+        from grimoire_studio.services.object_service import ObjectInstantiationService
+
+        service = ObjectInstantiationService(sample_flow_system)
+        flow_def = sample_flow_system.flows["test_flow"]
+        service.create_object = lambda data: data
+
+        with pytest.raises(
+            RuntimeError,
+            match="Cannot convert input 'player_level' value 'abc' to type 'int'",
+        ):
+            service.instantiate_flow_input(
+                flow_def,
+                {"player_name": "Hero", "player_level": "abc", "player_char": {}},
+            )
+
+    def test_flow_plan_is_reused(self, sample_flow_system):
+        """Test that each flow's entry plan is computed once per kind."""
+        from grimoire_studio.services.object_service import ObjectInstantiationService
+
+        service = ObjectInstantiationService(sample_flow_system)
+        flow_def = sample_flow_system.flows["test_flow"]
+
+        plan = service._flow_plan(flow_def, "input")
+
+        assert plan is service._flow_plan(flow_def, "input")
+        assert [entry[0] for entry in plan] == [
+            "player_name",
+            "player_level",
+            "player_char",
+        ]
+        assert [entry[3] for entry in plan] == [True, False, True]
+        assert service._flow_plan(flow_def, "output") is not plan
+
+        service.create_object = lambda data: {"validated_object": data}
+        result = service.instantiate_flow_variable(
+            flow_def, {"temp_value": "7", "temp_item": {"name": "Rope"}}
+        )
+        assert result["temp_value"] == 7
+        assert result["temp_item"]["validated_object"]["model"] == "item"
+
+    def test_flow_schedule_dropped_with_flow(self, sample_flow_system):
+        """Test that cached plans do not keep a discarded flow alive."""
+        from grimoire_studio.services.object_service import ObjectInstantiationService
+
+        service = ObjectInstantiationService(sample_flow_system)
+        flow_def = FlowDefinition(
+            id="temp_flow",
+            kind="flow",
+            name="Temp Flow",
+            inputs=[FlowInputOutput(type="int", id="count", required=True)],
+        )
+
+        assert service.instantiate_flow_input(flow_def, {"count": "3"}) == {"count": 3}
+        assert len(service._flow_schedules) == 1
+
+        del flow_def
+        gc.collect()
+
+        assert service._flow_schedules == {}
+
     def test_validate_primitive_type_success(self, sample_system):
         """Test primitive type validation success."""
         from grimoire_studio.services.object_service import ObjectInstantiationService
@@ -6,6 +6,7 @@ message display, tab management, logging integration, and content formatting.
 """
 
 import logging
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -101,6 +102,25 @@ class TestOutputConsoleBusinessLogic:
         # Should not contain file references
         assert " (in " not in content
 
+    def test_validation_results_appended_in_one_update(self, output_console):
+        """Test that a validation block is appended at once, in result order."""
+        results = [
+            {"level": "warning", "message": "First"},
+            {"level": "error", "message": "Second"},
+            {"level": "warning", "message": "Third"},
+        ]
+
+        with patch.object(
+            output_console,
+            "_append_colored_runs",
+            wraps=output_console._append_colored_runs,
+        ) as append_runs:
+            output_console.display_validation_results(results, auto_switch=False)
+
+        append_runs.assert_called_once()
+        content = output_console._validation_text.toPlainText()
+        assert content.index("First") < content.index("Second") < content.index("Third")
+
     def test_validation_results_auto_switch(self, output_console, qtbot):
         """Test that validation results auto-switch to validation tab."""
         # Start on a different tab
@@ -128,6 +148,18 @@ class TestOutputConsoleBusinessLogic:
             content = output_console._execution_text.toPlainText()
             assert f"[{expected_prefix}] {message}" in content
 
+    def test_unknown_levels_display_as_info(self, output_console):
+        """Test that unrecognised message levels fall back to info."""
+        output_console.display_execution_output("Odd", "TRACE", auto_switch=False)
+        output_console.display_validation_results(
+            [{"level": "hint", "message": "Odd result"}], auto_switch=False
+        )
+        output_console.display_log_message("Custom", logging.INFO + 5, "test")
+
+        assert "[INFO] Odd" in output_console._execution_text.toPlainText()
+        assert "ℹ️  INFO: Odd result" in output_console._validation_text.toPlainText()
+        assert "INFO test: Custom" in output_console._logs_text.toPlainText()
+
     def test_execution_output_auto_switch(self, output_console):
         """Test that execution output auto-switches to execution tab."""
         # Start on validation tab
@@ -260,11 +292,58 @@ class TestOutputConsoleBusinessLogic:
         assert font.styleHint() == font.StyleHint.Monospace
         assert font.pointSize() == 13  # Updated from 11 to 13 for better readability
 
+    def test_console_font_resolved_once(self, qtbot):
+        """Test that all tabs share one console font lookup."""
+        with patch.object(
+            OutputConsole,
+            "_get_console_font",
+            autospec=True,
+            side_effect=OutputConsole._get_console_font,
+        ) as get_font:
+            console = OutputConsole()
+            qtbot.addWidget(console)
+
+        get_font.assert_called_once()
+        assert console._logs_text.font() == console._validation_text.font()
+
+    def test_char_formats_are_reused_per_color(self, output_console):
+        """Test that one character format is kept per color."""
+        error_format = output_console._get_char_format(QColor("#dc3545"))
+        assert error_format is output_console._get_char_format(
+            output_console.ERROR_COLOR
+        )
+        assert error_format.foreground().color() == output_console.ERROR_COLOR
+
+        output_console.display_execution_output("Failed", "error", auto_switch=False)
+
+        cursor = output_console._execution_text.textCursor()
+        cursor.movePosition(cursor.MoveOperation.Start)
+        cursor.movePosition(cursor.MoveOperation.NextCharacter)
+        assert cursor.charFormat().foreground().color() == output_console.ERROR_COLOR
+
+    def test_tabs_keep_limited_lines(self, output_console):
+        """Test that tabs drop their oldest lines past the line limit."""
+        assert output_console._logs_text.document().maximumBlockCount() == 10000
+        assert not output_console._logs_text.isUndoRedoEnabled()
+
+        output_console.set_max_lines("execution", 3)
+        for i in range(5):
+            output_console.display_execution_output(f"Line {i}", auto_switch=False)
+
+        content = output_console._execution_text.toPlainText()
+        assert "Line 0" not in content
+        assert "Line 1" not in content
+        assert "Line 4" in content
+
+        with pytest.raises(ValueError, match="Unknown console tab"):
+            output_console.set_max_lines("output", 10)
+
     def test_timestamp_format(self, output_console):
         """Test that timestamps are included in messages."""
-        with patch("grimoire_studio.ui.components.output_console.datetime") as mock_dt:
-            mock_dt.now.return_value.strftime.return_value = "12:34:56"
-
+        with patch(
+            "grimoire_studio.ui.components.output_console._timestamp",
+            return_value="12:34:56",
+        ):
             output_console.display_execution_output("Test", auto_switch=False)
             content = output_console._execution_text.toPlainText()
             assert "[12:34:56]" in content
@@ -288,6 +367,51 @@ class TestOutputConsoleBusinessLogic:
 
         assert blocker.args == ["logs"]
 
+    def test_logging_from_worker_thread(self, output_console, qtbot):
+        """Test that records logged off the GUI thread reach the logs tab."""
+        worker = threading.Thread(
+            target=logging.getLogger("test.worker").warning, args=("From worker",)
+        )
+        worker.start()
+        worker.join()
+
+        qtbot.waitUntil(
+            lambda: "From worker" in output_console._logs_text.toPlainText()
+        )
+        assert "WARNING test.worker: From worker" in (
+            output_console._logs_text.toPlainText()
+        )
+
+    def test_logged_records_are_written_per_flush(self, output_console, qtbot):
+        """Test that records from the logging system are written in one update."""
+        output_console._log_received.emit("First", logging.INFO, "test.a")
+        output_console._log_received.emit("Second", logging.INFO, "test.a")
+        output_console._log_received.emit("Hidden", logging.DEBUG, "test.a")
+        output_console._log_received.emit("Third", logging.ERROR, "test.b")
+
+        # Nothing is written until the flush timer fires
+        assert output_console._logs_text.toPlainText() == ""
+
+        with qtbot.waitSignal(output_console.content_added) as blocker:
+            pass
+
+        assert blocker.args == ["logs"]
+        lines = output_console._logs_text.toPlainText().splitlines()
+        assert [line.split("] ", 1)[1] for line in lines] == [
+            "INFO test.a: First",
+            "INFO test.a: Second",
+            "ERROR test.b: Third",
+        ]
+
+    def test_close_detaches_queue_handler(self, output_console):
+        """Test that closing the console stops listening to the root logger."""
+        queue_handler = output_console._queue_handler
+        assert queue_handler in logging.getLogger().handlers
+
+        output_console.close()
+
+        assert queue_handler not in logging.getLogger().handlers
+
 
 class TestLogHandler:
     """Test the LogHandler custom logging handler."""
@@ -307,7 +431,7 @@ class TestLogHandler:
         handler = LogHandler(mock_console, prefix="[TEST] ")
         assert handler._output_console is mock_console
         assert handler._prefix == "[TEST] "
-        assert handler._message_queue == []
+        assert list(handler._message_queue) == []
 
     def test_log_handler_emit(self, log_handler):
         """Test emitting log records."""
@@ -404,3 +528,46 @@ class TestLogHandler:
             message, level, logger_name = log_handler._message_queue[i]
             assert f"Message {i}" in message
             assert logger_name == f"test{i}"
+
+    def test_message_queue_drops_oldest_when_full(self, mock_console):
+        """Test that a full batching queue keeps the newest and reports the rest."""
+        with patch.object(LogHandler, "MAX_QUEUED_MESSAGES", 2):
+            handler = LogHandler(mock_console)
+        for i in range(3):
+            handler.emit(
+                logging.LogRecord("test", logging.INFO, "", 0, f"M{i}", (), None)
+            )
+
+        handler._flush_messages()
+
+        displayed = mock_console.display_log_message.call_args_list
+        assert [call.args[0] for call in displayed] == [
+            "1 log messages dropped",
+            "M1",
+            "M2",
+        ]
+        assert displayed[0].args[1] == logging.WARNING
+        assert len(handler._message_queue) == 0
+
+        handler.emit(logging.LogRecord("test", logging.INFO, "", 0, "M3", (), None))
+        handler._flush_messages()
+
+        assert displayed[-1].args[0] == "M3"
+        assert len(displayed) == 4
+
+
+class TestTimestamp:
+    """Test the cached console timestamp."""
+
+    def test_timestamp_formatted_once_per_second(self):
+        """Test that the timestamp text is reused within the same second."""
+        from grimoire_studio.ui.components import output_console
+
+        with patch.object(output_console, "_last_timestamp", (-1, "")):
+            with patch.object(output_console, "time") as mock_time:
+                mock_time.time.side_effect = [0.2, 0.9, 1.1]
+                mock_time.strftime.side_effect = ["first", "second"]
+                stamps = [output_console._timestamp() for _ in range(3)]
+
+        assert stamps == ["first", "first", "second"]
+        assert mock_time.strftime.call_count == 2
@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from PyQt6.QtWidgets import QApplication
@@ -113,3 +114,30 @@ class TestOutputConsoleRelativePaths:
         assert (
             str(temp_project_dir) not in validation_text
         )  # Absolute path should not appear
+
+    def test_relative_paths_cached_per_project_root(
+        self, output_console, temp_project_dir
+    ):
+        """Test that display paths are reused until the project root changes."""
+        test_file = str(temp_project_dir / "flows" / "test_flow.yaml")
+        output_console.set_project_root(str(temp_project_dir))
+
+        resolve_calls = []
+        original_resolve = Path.resolve
+
+        def counting_resolve(path, *args, **kwargs):
+            resolve_calls.append(path)
+            return original_resolve(path, *args, **kwargs)
+
+        with patch.object(Path, "resolve", counting_resolve):
+            assert output_console._get_relative_path(test_file) == (
+                "flows/test_flow.yaml"
+            )
+            assert output_console._get_relative_path(test_file) == (
+                "flows/test_flow.yaml"
+            )
+        assert len(resolve_calls) == 1
+
+        # A new project root invalidates the cached display paths
+        output_console.set_project_root(str(temp_project_dir / "flows"))
+        assert output_console._get_relative_path(test_file) == "test_flow.yaml"
@@ -230,9 +230,10 @@ class TestOutputConsoleUI:
 
     def test_execution_output_timestamping(self, output_console):
         """Test that execution output includes timestamps."""
-        with patch("grimoire_studio.ui.components.output_console.datetime") as mock_dt:
-            mock_dt.now.return_value.strftime.return_value = "15:30:45"
-
+        with patch(
+            "grimoire_studio.ui.components.output_console._timestamp",
+            return_value="15:30:45",
+        ):
             output_console.display_execution_output("Test message", auto_switch=False)
             content = output_console._execution_text.toPlainText()
 
@@ -241,9 +242,10 @@ class TestOutputConsoleUI:
 
     def test_log_message_formatting(self, output_console):
         """Test that log messages are formatted correctly."""
-        with patch("grimoire_studio.ui.components.output_console.datetime") as mock_dt:
-            mock_dt.now.return_value.strftime.return_value = "10:15:20"
-
+        with patch(
+            "grimoire_studio.ui.components.output_console._timestamp",
+            return_value="10:15:20",
+        ):
             output_console.display_log_message(
                 "Test log", logging.WARNING, "test.module"
             )
@@ -291,20 +293,20 @@ class TestOutputConsoleUI:
 
     def test_widget_styling(self, output_console):
         """Test that widgets have proper styling applied."""
-        # Check that text areas have styling
-        validation_style = output_console._validation_text.styleSheet()
-        execution_style = output_console._execution_text.styleSheet()
-        logs_style = output_console._logs_text.styleSheet()
-
-        # All should have some styling
-        assert validation_style.strip() != ""
-        assert execution_style.strip() != ""
-        assert logs_style.strip() != ""
+        # Text areas are styled by one stylesheet on the console
+        console_style = output_console.styleSheet()
+        assert "#OutputConsole QTextEdit" in console_style
+        assert output_console.objectName() == "OutputConsole"
 
         # Check for expected style properties
-        assert "background-color" in validation_style
-        assert "border" in validation_style
-        assert "padding" in validation_style
+        assert "background-color" in console_style
+        assert "border" in console_style
+        assert "padding" in console_style
+
+        # No text area overrides it with its own stylesheet
+        assert output_console._validation_text.styleSheet() == ""
+        assert output_console._execution_text.styleSheet() == ""
+        assert output_console._logs_text.styleSheet() == ""
 
     def test_clear_button_positions(self, output_console):
         """Test that clear buttons are positioned correctly."""
@@ -0,0 +1,42 @@
+"""Tests for lazy exports of the UI packages."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def test_submodule_import_does_not_load_siblings() -> None:
+    """Test that importing one component leaves the others unloaded."""
+    code = (
+        "import sys\n"
+        "import grimoire_studio.ui.components.yaml_highlighter\n"
+        "assert 'grimoire_studio.ui.components.project_browser' not in sys.modules\n"
+        "assert 'grimoire_studio.ui.components.output_console' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize(
+    ("package", "names"),
+    [
+        (
+            "grimoire_studio.ui.components",
+            ["OutputConsole", "ProjectBrowser", "YamlSyntaxHighlighter"],
+        ),
+        ("grimoire_studio.ui.dialogs", ["FlowTestDialog", "NewProjectDialog"]),
+        ("grimoire_studio.ui.views", ["YamlEditorView"]),
+    ],
+)
+def test_exports_resolve_on_access(package: str, names: list[str]) -> None:
+    """Test that every exported name resolves to its class."""
+    module = __import__(package, fromlist=names)
+    assert sorted(module.__all__) == sorted(names)
+    for name in names:
+        assert getattr(module, name).__name__ == name
+
+    with pytest.raises(AttributeError):
+        module.NotExported  # noqa: B018